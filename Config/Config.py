@@ -34,6 +34,7 @@ las constantes, rutas, parámetros y configuraciones en un solo lugar.
 
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 # ============================================================================
 # 📁 RUTAS DEL PROYECTO
@@ -70,7 +71,8 @@ CHUNK_SIZE = 100_000
 # Define qué columnas esperamos encontrar y cómo clasificarlas
 
 # Todas las columnas esperadas en el dataset original
-EXPECTED_COLUMNS = [
+# (tupla: el orden importa y no debe modificarse en tiempo de ejecución)
+EXPECTED_COLUMNS = (
     'date',              # Fecha del registro (YYYY-MM-DD)
     'county',            # Nombre del condado (ej: Los Angeles)
     'state',             # Nombre del estado (ej: California)
@@ -88,7 +90,7 @@ EXPECTED_COLUMNS = [
     'transit',           # Cambio % en uso de transporte público
     'workplaces',        # Cambio % en movilidad a lugares de trabajo
     'residential'        # Cambio % en tiempo en zonas residenciales
-]
+)
 
 # Columnas de movilidad (subconjunto de EXPECTED_COLUMNS)
 # Estas miden cambios de comportamiento durante la pandemia
@@ -117,9 +119,36 @@ NUMERIC_COLUMNS = [
 # Columnas de fecha (requieren parsing especial)
 DATE_COLUMNS = ['date']
 
+# Formato de las fechas en el CSV (ISO: 2021-01-31)
+# Pasarlo explícito a pd.to_datetime evita que pandas adivine el formato
+# valor por valor
+DATE_FORMAT = '%Y-%m-%d'
+
 # Columnas categóricas (texto, no numéricas)
 CATEGORICAL_COLUMNS = ['county', 'state']
 
+# Versión frozenset para preguntar "¿esta columna es esperada?" en O(1)
+# Uso: `if col in EXPECTED_COLUMNS_SET` en lugar de recorrer la lista
+EXPECTED_COLUMNS_SET = frozenset(EXPECTED_COLUMNS)
+
+# Tipos de dato para leer el CSV (evita que pandas los infiera por chunk)
+# - Conteos y códigos: enteros "nullable" (Int32/Int8 aceptan vacíos)
+# - Movilidad: float32 (valores enteros entre -100 y +500, sin pérdida)
+# - county/state: category (pocas cadenas distintas, repetidas miles de veces)
+READ_DTYPES = {
+    **{c: 'float32' for c in MOBILITY_COLUMNS},
+    'fips': 'Int32',
+    'cases': 'Int32',
+    'deaths': 'Int32',
+    'daily_cases': 'Int32',
+    'daily_deaths': 'Int32',
+    'day_of_week': 'Int8',
+    'is_weekend': 'Int8',
+    'is_holiday': 'Int8',
+    'county': 'category',
+    'state': 'category',
+}
+
 # ============================================================================
 # 🧹 CONFIGURACIÓN DE LIMPIEZA
 # ============================================================================
@@ -128,11 +157,25 @@ CATEGORICAL_COLUMNS = ['county', 'state']
 # Valores que deben considerarse como NaN (vacíos/nulos)
 # Incluye variaciones comunes de "vacío" en diferentes sistemas
 NULL_VALUES = ['', 'nan', 'NaN', 'NA', 'N/A', 'null', 'NULL', 'None']
+NULL_VALUES_SET = frozenset(NULL_VALUES)  # Para preguntas de pertenencia en O(1)
 
 # Estrategia de manejo de duplicados
 DROP_DUPLICATES = True  # Si True, elimina duplicados; si False, los mantiene
-DUPLICATE_SUBSET = ['date', 'county', 'state']  # Columnas para identificar duplicados
-# Ejemplo: si hay 2 filas con misma fecha + county + state, se considera duplicado
+DUPLICATE_SUBSET = ['date', 'county', 'state', 'fips']  # Columnas para identificar duplicados
+# Ejemplo: si hay 2 filas con misma fecha + county + state + fips, se considera duplicado
+# (fips es necesario: "baltimore" ciudad y condado comparten nombre y estado)
+
+# Filtro de Bloom para duplicados globales en Clean.py
+# Guarda ~34 bits por fila en lugar de un set de Python (~120 bytes por fila).
+# A cambio, una fila única puede descartarse con probabilidad DEDUP_ERROR_RATE.
+DEDUP_CAPACITY = 1_000_000    # Filas esperadas antes de crecer (el filtro se duplica si se llena)
+DEDUP_ERROR_RATE = 1e-7       # Tasa de falsos positivos (1 en 10 millones)
+
+# Compresión del CSV limpio: None (sin comprimir), 'gzip' o 'zstd'
+# ('zstd' requiere el paquete zstandard). pd.read_csv la detecta sola por la
+# extensión, así que conviene nombrar la salida .csv.gz / .csv.zst
+OUTPUT_COMPRESSION = None
+OUTPUT_COMPRESSION_LEVEL = 3  # zstd nivel 3 ≈ 3× más pequeño a ~500 MB/s
 
 # ============================================================================
 # 📊 CONFIGURACIÓN DE VISUALIZACIÓN
@@ -210,13 +253,17 @@ PROJECT_YEAR = 2026
 # ============================================================================
 # Funciones de utilidad que usan las configuraciones anteriores
 
+# True después de la primera llamada a ensure_directories() en este proceso
+_dirs_ready = False
+
+
 def ensure_directories():
     """
     🛠️ Crea los directorios necesarios si no existen.
     
     Esta función debe llamarse al inicio de cualquier script que necesite
-    guardar archivos. Es seguro llamarla múltiples veces (no da error si
-    el directorio ya existe).
+    guardar archivos. Es seguro llamarla múltiples veces: solo la primera
+    llamada del proceso toca el disco, las siguientes retornan de inmediato.
     
     Directorios creados:
     - Output/           : Para archivos procesados (CSV, metadatos)
@@ -228,10 +275,32 @@ def ensure_directories():
         >>> ensure_directories()
         >>> # Ahora puedes guardar archivos en Output/ y Output/figures/
     """
+    global _dirs_ready
+    if _dirs_ready:
+        return
+    
+    # exist_ok=True: no da error si ya existe (no hace falta consultar antes)
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)    # Crea Output/ y subdirectorios si no existen
     FIGURES_DIR.mkdir(parents=True, exist_ok=True)   # Crea Output/figures/ si no existe
-    if not DATA_DIR.exists():
-        DATA_DIR.mkdir(parents=True, exist_ok=True)  # Crea Data/ si no existe
+    DATA_DIR.mkdir(parents=True, exist_ok=True)      # Crea Data/ si no existe
+    _dirs_ready = True
+
+
+# Resumen armado UNA vez al importar: las rutas no cambian durante la
+# ejecución, así que no hace falta convertirlas a str en cada llamada.
+# MappingProxyType es una vista de solo lectura (nadie puede modificarlo).
+_CONFIG_SUMMARY = MappingProxyType({
+    'project_name': PROJECT_NAME,
+    'version': PROJECT_VERSION,
+    'raw_data': str(RAW_DATA_FILE),
+    'cleaned_data': str(CLEANED_DATA_FILE),
+    'chunk_size': CHUNK_SIZE,
+    'output_dir': str(OUTPUT_DIR),
+    'figures_dir': str(FIGURES_DIR),
+    'moving_avg_window': MOVING_AVERAGE_WINDOW,
+    'top_n_counties': TOP_N_COUNTIES,
+    'top_n_states': TOP_N_STATES,
+})
 
 
 def get_config_summary():
@@ -244,7 +313,8 @@ def get_config_summary():
     - Debugging y reportes
     
     Returns:
-        dict: Diccionario con configuraciones principales
+        Mapping de solo lectura con configuraciones principales
+        (usa dict(...) si necesitas una copia modificable)
         
     Ejemplo:
         >>> from Config.Config import get_config_summary
@@ -252,18 +322,7 @@ def get_config_summary():
         >>> print(f"Procesando: {config['project_name']} v{config['version']}")
         >>> print(f"Chunk size: {config['chunk_size']:,} filas")
     """
-    return {
-        'project_name': PROJECT_NAME,
-        'version': PROJECT_VERSION,
-        'raw_data': str(RAW_DATA_FILE),
-        'cleaned_data': str(CLEANED_DATA_FILE),
-        'chunk_size': CHUNK_SIZE,
-        'output_dir': str(OUTPUT_DIR),
-        'figures_dir': str(FIGURES_DIR),
-        'moving_avg_window': MOVING_AVERAGE_WINDOW,
-        'top_n_counties': TOP_N_COUNTIES,
-        'top_n_states': TOP_N_STATES,
-    }
+    return _CONFIG_SUMMARY
 
 
 # ============================================================================
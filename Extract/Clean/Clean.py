@@ -31,10 +31,283 @@ los datos crudos para que estén listos para análisis.
 from __future__ import annotations
 
 import argparse
+import csv
+import gzip
+import hashlib
+import json
+import math
 import os
-from typing import Optional
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
 
+import numpy as np
 import pandas as pd
+from pandas.util import hash_pandas_object
+
+# ============================================================================
+# IMPORTAR CONFIGURACIONES
+# ============================================================================
+
+try:
+	from Config.Config import (
+		CATEGORICAL_COLUMNS,
+		DATE_FORMAT,
+		DEDUP_CAPACITY,
+		DEDUP_ERROR_RATE,
+		DUPLICATE_SUBSET,
+		EXPECTED_COLUMNS_SET,
+		NULL_VALUES,
+		NULL_VALUES_SET,
+		OUTPUT_COMPRESSION,
+		OUTPUT_COMPRESSION_LEVEL,
+		READ_DTYPES,
+	)
+except ImportError:
+	CATEGORICAL_COLUMNS = ['county', 'state']
+	DATE_FORMAT = '%Y-%m-%d'
+	DEDUP_CAPACITY = 1_000_000
+	DEDUP_ERROR_RATE = 1e-7
+	DUPLICATE_SUBSET = ['date', 'county', 'state', 'fips']
+	EXPECTED_COLUMNS_SET = frozenset()
+	NULL_VALUES = ['', 'nan', 'NaN', 'NA', 'N/A', 'null', 'NULL', 'None']
+	NULL_VALUES_SET = frozenset(NULL_VALUES)
+	OUTPUT_COMPRESSION = None
+	OUTPUT_COMPRESSION_LEVEL = 3
+	READ_DTYPES = {}
+
+# PyArrow es opcional: si está instalado, el CSV se parsea con su lector
+# multihilo en C++; si no, se usa pd.read_csv por chunks como siempre.
+try:
+	import pyarrow as pa
+	import pyarrow.csv as pacsv
+	import pyarrow.parquet as pq
+except ImportError:
+	pa = None
+	pacsv = None
+	pq = None
+
+# Escritor CSV con Arrow que produce el mismo texto que to_csv (compartido
+# con DataLoader.save_to_csv_chunked)
+try:
+	from Load.Load import write_csv_arrow
+except ImportError:
+	write_csv_arrow = None
+
+# Polars es opcional: con clean_csv(engine="polars") todo el proceso
+# (lectura, limpieza, duplicados y escritura) corre en su motor de Rust.
+try:
+	import polars as pl
+except ImportError:
+	pl = None
+
+# zstandard es opcional: solo se necesita con compression="zstd"
+try:
+	import zstandard as zstd
+except ImportError:
+	zstd = None
+
+# cuDF es opcional: con clean_csv(engine="cudf") la limpieza de texto,
+# fechas y duplicados corre en la GPU (requiere GPU NVIDIA + RAPIDS)
+try:
+	import cudf
+except ImportError:
+	cudf = None
+
+# Numba es opcional: compila a código nativo el bucle de deduplicación
+# exacta (ExactHashSet). Sin Numba se usa un set de Python.
+try:
+	from numba import njit, types as nb_types
+	from numba.typed import Dict as NumbaDict
+except ImportError:
+	njit = None
+
+# Bytes aproximados por fila del CSV, para traducir chunk_size (filas) al
+# block_size (bytes) que usa el lector de PyArrow.
+_BYTES_PER_ROW_ESTIMATE = 128
+
+# Fechas ISO (YYYY-MM-DD): si el primer valor de una columna de fecha tiene
+# esta forma, se parsea con DATE_FORMAT en lugar de dejar que pandas adivine
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Texto en pandas: con PyArrow, StringDtype usa sus kernels UTF-8 en C++
+# (.str.strip, isin); sin él, el StringDtype de Python
+_STRING_DTYPE = "string[pyarrow]" if pa is not None else "string"
+
+# Tabla de traducción de normalize_column_name: " " y "\n" → "_"
+_NORMALIZE_TABLE = str.maketrans({" ": "_", "\n": "_"})
+
+# Equivalencias de READ_DTYPES (pandas) a tipos de Arrow. Arrow no acepta
+# "4239.0" como entero, así que los enteros se leen como float64 y se pasan
+# al entero nullable de pandas después de to_pandas().
+if pa is not None:
+	_ARROW_TYPES = {
+		'float32': pa.float32(),
+		'Int32': pa.float64(),
+		'Int8': pa.float64(),
+		'category': pa.dictionary(pa.int32(), pa.string()),
+	}
+
+# Equivalencias de READ_DTYPES a tipos de Polars (mismo truco de enteros que
+# en Arrow: se leen como Float64 y se convierten después)
+if pl is not None:
+	_POLARS_TYPES = {
+		'float32': pl.Float32,
+		'Int32': pl.Float64,
+		'Int8': pl.Float64,
+		'category': pl.String,
+	}
+	_POLARS_CASTS = {'Int32': pl.Int32, 'Int8': pl.Int8}
+
+
+class ScalableBloomFilter:
+	"""
+	🌸 FILTRO DE BLOOM ESCALABLE - Recuerda hashes con memoria acotada
+
+	Un filtro de Bloom responde "¿ya vi este hash?" usando un arreglo de bits
+	en lugar de guardar cada valor. Nunca olvida un hash agregado, pero puede
+	dar un falso positivo con probabilidad `error_rate`.
+
+	Cuando un filtro se llena se agrega otro con el doble de capacidad y la
+	mitad de tasa de error, así la tasa total se mantiene por debajo de
+	2 × error_rate sin conocer el tamaño del archivo de antemano.
+
+	Args:
+		initial_capacity: Elementos esperados en el primer filtro
+		error_rate: Probabilidad de falso positivo deseada
+
+	Ejemplo:
+		>>> bloom = ScalableBloomFilter(initial_capacity=1000)
+		>>> hashes = np.array([1, 2, 3], dtype=np.uint64)
+		>>> bloom.add(hashes)
+		>>> bloom.contains(np.array([2, 99], dtype=np.uint64))
+		array([ True, False])
+	"""
+
+	def __init__(self, initial_capacity: int = DEDUP_CAPACITY, error_rate: float = DEDUP_ERROR_RATE):
+		self.initial_capacity = initial_capacity
+		self.error_rate = error_rate
+		self._filters: list[dict] = []
+		self._add_filter()
+
+	def _add_filter(self) -> None:
+		level = len(self._filters)
+		capacity = self.initial_capacity * (2 ** level)
+		error = self.error_rate * (0.5 ** level)
+		# Fórmulas estándar: m = -n·ln(p) / ln(2)², k = (m/n)·ln(2)
+		n_bits = int(math.ceil(-capacity * math.log(error) / (math.log(2) ** 2)))
+		n_hashes = max(1, int(round(n_bits / capacity * math.log(2))))
+		self._filters.append({
+			"bits": np.zeros((n_bits + 7) // 8, dtype=np.uint8),
+			"n_bits": np.uint64(n_bits),
+			"n_hashes": n_hashes,
+			"capacity": capacity,
+			"count": 0,
+		})
+
+	@staticmethod
+	def _positions(hashes: np.ndarray, flt: dict) -> np.ndarray:
+		# Doble hashing: posición_i = h1 + i·h2 (mod m), derivado de un solo uint64
+		h1 = hashes & np.uint64(0xFFFFFFFF)
+		h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+		steps = np.arange(flt["n_hashes"], dtype=np.uint64)
+		return (h1[:, None] + steps[None, :] * h2[:, None]) % flt["n_bits"]
+
+	def contains(self, hashes: np.ndarray) -> np.ndarray:
+		"""Retorna una máscara booleana: True si el hash (probablemente) ya se vio."""
+		hashes = np.asarray(hashes, dtype=np.uint64)
+		found = np.zeros(len(hashes), dtype=bool)
+		for flt in self._filters:
+			pos = self._positions(hashes, flt)
+			bits = (flt["bits"][pos >> np.uint64(3)] >> (pos & np.uint64(7)).astype(np.uint8)) & 1
+			found |= bits.all(axis=1)
+		return found
+
+	def add(self, hashes: np.ndarray) -> None:
+		"""Agrega hashes al filtro, creando un filtro nuevo si el actual se llena."""
+		hashes = np.asarray(hashes, dtype=np.uint64)
+		while len(hashes):
+			flt = self._filters[-1]
+			room = flt["capacity"] - flt["count"]
+			if room <= 0:
+				self._add_filter()
+				continue
+			batch, hashes = hashes[:room], hashes[room:]
+			pos = self._positions(batch, flt).ravel()
+			np.bitwise_or.at(
+				flt["bits"],
+				pos >> np.uint64(3),
+				np.left_shift(1, pos & np.uint64(7)).astype(np.uint8),
+			)
+			flt["count"] += len(batch)
+
+
+	def filter_new(self, hashes: np.ndarray) -> np.ndarray:
+		"""
+		Retorna True para los hashes nuevos y los agrega al filtro.
+
+		Un hash repetido dentro del mismo arreglo cuenta como nuevo solo la
+		primera vez (igual que si se agregaran uno por uno).
+		"""
+		hashes = np.asarray(hashes, dtype=np.uint64)
+		mask = ~self.contains(hashes) & ~pd.Index(hashes).duplicated(keep="first")
+		self.add(hashes[mask])
+		return mask
+
+
+def _exact_dedup_mask(hashes, seen):
+	# True si el hash no estaba en `seen` (y lo agrega). Con Numba, `seen` es
+	# un numba.typed.Dict (Numba no tiene Set tipado) y el bucle corre nativo.
+	n = len(hashes)
+	mask = np.empty(n, dtype=np.bool_)
+	for i in range(n):
+		h = hashes[i]
+		if h in seen:
+			mask[i] = False
+		else:
+			mask[i] = True
+			seen[h] = True
+	return mask
+
+
+if njit is not None:
+	_exact_dedup_mask = njit(cache=True)(_exact_dedup_mask)
+
+
+class ExactHashSet:
+	"""
+	🎯 CONJUNTO EXACTO DE HASHES - Deduplicación sin falsos positivos
+
+	Alternativa a ScalableBloomFilter cuando no se acepta descartar por
+	error una fila única: guarda cada hash visto, así que la memoria crece
+	con el número de filas únicas (~50-100 bytes por hash).
+
+	Si Numba está instalado, el bucle que revisa y agrega hashes se compila
+	a código nativo; si no, corre en Python sobre un dict.
+
+	Ejemplo:
+		>>> seen = ExactHashSet()
+		>>> seen.filter_new(np.array([1, 2, 1], dtype=np.uint64))
+		array([ True,  True, False])
+	"""
+
+	def __init__(self):
+		if njit is not None:
+			self._seen = NumbaDict.empty(key_type=nb_types.uint64, value_type=nb_types.boolean)
+		else:
+			self._seen = {}
+
+	def __len__(self) -> int:
+		return len(self._seen)
+
+	def filter_new(self, hashes: np.ndarray) -> np.ndarray:
+		"""Retorna True para los hashes nuevos y los agrega al conjunto."""
+		hashes = np.ascontiguousarray(hashes, dtype=np.uint64)
+		if njit is None:
+			hashes = hashes.tolist()
+		return _exact_dedup_mask(hashes, self._seen)
 
 
 def normalize_column_name(name: str) -> str:
@@ -64,38 +337,274 @@ def normalize_column_name(name: str) -> str:
 		>>> normalize_column_name("RETAIL & Recreation")
 		'retail_&_recreation'
 	"""
-	# Paso 1: Quitar espacios al inicio/final
-	name = name.strip()
-	
-	# Paso 2: Convertir a minúsculas
-	name = name.lower()
-	
-	# Paso 3: Reemplazar espacios por _
-	name = name.replace(" ", "_")
-	
-	# Paso 4: Reemplazar saltos de línea por _
-	name = name.replace("\n", "_")
-	
-	return name
+	# Pasos 1-2: quitar espacios al inicio/final y pasar a minúsculas;
+	# pasos 3-4: espacios y saltos de línea → "_" en una sola pasada
+	return name.strip().lower().translate(_NORMALIZE_TABLE)
+
 
+def _read_header(input_path: str) -> list[str]:
+	"""Lee solo la primera línea del CSV y retorna los nombres de columnas."""
+	with open(input_path, newline="", encoding="utf-8") as f:
+		return next(csv.reader(f), [])
 
-def clean_chunk(df: pd.DataFrame) -> pd.DataFrame:
+
+def _resolve_columns(input_path: str) -> tuple[list[str], list[str]]:
 	"""
-	🧹 LIMPIAR CHUNK - Limpia un bloque de datos
-	
-	Qué hace:
+	Decide qué columnas leer y su nombre normalizado, UNA vez por archivo.
+
+	Normaliza cada nombre del header una sola vez; si el archivo tiene
+	columnas de EXPECTED_COLUMNS solo se leen esas, si no, todas.
+
+	Returns:
+		(nombres originales a leer, nombres normalizados en el mismo orden)
+	"""
+	raw_columns = _read_header(input_path)
+	normalized = [normalize_column_name(c) for c in raw_columns]
+	pairs = [(raw, name) for raw, name in zip(raw_columns, normalized) if name in EXPECTED_COLUMNS_SET]
+	if not pairs:
+		# Archivo con otro esquema: leer todas sus columnas
+		pairs = list(zip(raw_columns, normalized))
+	return [raw for raw, _ in pairs], [name for _, name in pairs]
+
+
+def iter_csv_chunks(input_path: str, chunk_size: int = 100_000):
+	"""
+	📦 LEER CSV POR CHUNKS - Genera DataFrames con columnas ya normalizadas
+
+	Si PyArrow está instalado, mapea el archivo en memoria y usa
+	`pyarrow.csv.open_csv`, que tokeniza en varios hilos en C++, reconoce
+	los valores nulos de NULL_VALUES y parsea fechas ISO (YYYY-MM-DD)
+	directamente. Si no, usa `pd.read_csv` por chunks.
+
+	En ambos casos:
+	- Si el archivo tiene las columnas de EXPECTED_COLUMNS, solo se leen esas
+	- Los tipos se fijan con READ_DTYPES (sin inferencia por chunk)
+	- Los nombres se normalizan UNA sola vez (desde el header)
+
+	Args:
+		input_path: Ruta al CSV de entrada
+		chunk_size: Filas aproximadas por chunk (con PyArrow el tamaño real
+			depende del block_size en bytes)
+
+	Yields:
+		DataFrames de pandas con nombres de columnas normalizados
+	"""
+	use_columns, columns = _resolve_columns(input_path)
+	dtypes = {
+		raw: READ_DTYPES[name]
+		for raw, name in zip(use_columns, columns)
+		if name in READ_DTYPES
+	}
+
+	if pacsv is None:
+		reader = pd.read_csv(
+			input_path,
+			chunksize=chunk_size,
+			usecols=use_columns,
+			dtype=dtypes,
+			na_values=NULL_VALUES,
+			engine="c",
+		)
+		for chunk in reader:
+			chunk.columns = columns
+			yield chunk
+		return
+
+	read_options = pacsv.ReadOptions(
+		block_size=chunk_size * _BYTES_PER_ROW_ESTIMATE,
+		use_threads=True,
+	)
+	convert_options = pacsv.ConvertOptions(
+		null_values=NULL_VALUES,
+		strings_can_be_null=True,
+		timestamp_parsers=[DATE_FORMAT],
+		include_columns=use_columns,
+		# Tipos fijos: además evita que una columna vacía en todo el primer
+		# bloque (p. ej. movilidad) se infiera como "null"
+		column_types={raw: _ARROW_TYPES[dtype] for raw, dtype in dtypes.items()},
+	)
+	int_dtypes = {
+		name: READ_DTYPES[name]
+		for name in columns
+		if READ_DTYPES.get(name, '').startswith('Int')
+	}
+	# El archivo se mapea en memoria: Arrow lee los bloques directo de las
+	# páginas del archivo (sin read() ni buffers de Python) y los reparte
+	# entre sus hilos para tokenizarlos en paralelo
+	with pa.memory_map(input_path, "r") as source:
+		reader = pacsv.open_csv(source, read_options=read_options, convert_options=convert_options)
+		for batch in reader:
+			chunk = batch.to_pandas(date_as_object=False)
+			chunk.columns = columns
+			yield chunk.astype(int_dtypes) if int_dtypes else chunk
+
+
+class ChunkCleaner:
+	"""
+	🧹 LIMPIADOR DE CHUNKS - Limpia bloques que comparten el mismo esquema
+
+	Las columnas de un CSV son las mismas en todos los chunks, así que QUÉ
+	columnas son de texto y cuáles de fecha se calcula UNA vez (al crear el
+	limpiador) y se reutiliza en cada chunk, en lugar de volver a revisar
+	tipos y nombres por cada bloque.
+
+	Qué hace (en cada chunk):
 	1. Limpia columnas de texto (strings):
 	   - Quita espacios extra: "  texto  " → "texto"
 	   - Convierte vacíos a NaN: "" → NaN
-	   - Convierte "nan" y "None" a NaN
+	   - Convierte "nan", "None", "NULL", etc. (NULL_VALUES) a NaN
+	   - Los nulos reales se quedan como nulos (nunca pasan por el texto
+	     "nan"): con PyArrow, strip ni siquiera los recorre (máscara de bits)
 	
-	2. Parsea columnas de fecha:
-	   - Detecta columnas con "date" en el nombre
-	   - Convierte a formato datetime de pandas
+	2. Convierte county/state (CATEGORICAL_COLUMNS) a `category`:
+	   - ~1,600 condados y ~50 estados repetidos en cientos de miles de filas
+	   - Cada fila guarda un código entero en lugar de un string de Python,
+	     y hashing/groupby trabajan sobre esos códigos
+
+	3. Parsea columnas de fecha:
+	   - Columnas con "date" en el nombre (o en date_formats)
+	   - Convierte a formato datetime de pandas con el formato de cada
+	     columna (DATE_FORMAT por defecto; None = que pandas lo infiera)
 	   - Si falla, deja los valores como están
+
+	Args:
+		columns: Nombres de todas las columnas
+		text_columns: Columnas de texto (object/string)
+		date_formats: Formato fijo por columna de fecha, ej. {'date': '%d/%m/%Y'}
+		date_columns: Columnas de fecha ya conocidas (opcional; si no, las
+			que tengan "date" en el nombre)
+
+	Ejemplo:
+		>>> cleaner = ChunkCleaner.from_frame(primer_chunk)
+		>>> for chunk in chunks:
+		...     chunk = cleaner.apply(chunk)
+	"""
+
+	def __init__(
+		self,
+		columns: Iterable[str],
+		text_columns: Iterable[str],
+		date_formats: Optional[dict[str, Optional[str]]] = None,
+		date_columns: Optional[Iterable[str]] = None,
+	):
+		columns = list(columns)
+		self.text_columns = list(text_columns)
+		# Columnas que identifican una fila (DUPLICATE_SUBSET); si el archivo
+		# no las tiene todas, los duplicados se buscan sobre la fila completa
+		self.key_columns = (
+			list(DUPLICATE_SUBSET)
+			if all(c in columns for c in DUPLICATE_SUBSET)
+			else None
+		)
+		self.category_columns = [c for c in CATEGORICAL_COLUMNS if c in self.text_columns]
+		# Buscar columnas que tengan "date" en el nombre (sin importar
+		# mayúsculas), salvo que quien llama ya las conozca
+		if date_columns is None:
+			self.date_columns = [c for c in columns if "date" in c.lower()]
+		else:
+			self.date_columns = [c for c in date_columns if c in columns]
+		self.date_formats = {c: DATE_FORMAT for c in self.date_columns}
+		if date_formats:
+			self.date_columns += [c for c in date_formats if c in columns and c not in self.date_formats]
+			self.date_formats.update(date_formats)
+
+	@classmethod
+	def from_frame(
+		cls,
+		df: pd.DataFrame,
+		date_formats: Optional[dict[str, Optional[str]]] = None,
+		date_columns: Optional[Iterable[str]] = None,
+	) -> "ChunkCleaner":
+		"""
+		Crea el limpiador a partir del esquema de un DataFrame de ejemplo.
+
+		Para las columnas de fecha sin formato en `date_formats`, revisa el
+		primer valor no nulo: si es ISO (YYYY-MM-DD) usa DATE_FORMAT, si no
+		deja que pandas infiera el formato.
+		"""
+		text_columns = df.select_dtypes(include=["object", "string", "category"]).columns
+		if date_columns is None:
+			date_columns = [c for c in df.columns if "date" in c.lower()]
+		date_columns = [c for c in date_columns if c in df.columns]
+		formats = {c: cls._sniff_date_format(df[c]) for c in date_columns}
+		formats.update(date_formats or {})
+		return cls(df.columns, text_columns, formats, date_columns)
+
+	@staticmethod
+	def _sniff_date_format(values: pd.Series) -> Optional[str]:
+		"""Retorna DATE_FORMAT si la columna ya es fecha o su primer valor es ISO."""
+		if pd.api.types.is_datetime64_any_dtype(values):
+			return DATE_FORMAT
+		first = values.first_valid_index()
+		if first is None or _ISO_DATE.match(str(values[first]).strip()):
+			return DATE_FORMAT
+		return None
+
+	@staticmethod
+	def _clean_text(values: pd.Series) -> pd.Series:
+		"""Quita espacios y convierte NULL_VALUES a nulo, sin pasar por astype(str)."""
+		if isinstance(values.dtype, pd.CategoricalDtype):
+			# Con category basta limpiar las categorías (~1,600 condados) en
+			# lugar de cada fila; solo si al quitar espacios no se juntan dos
+			categories = values.cat.categories
+			stripped = categories.str.strip()
+			if stripped.is_unique:
+				values = values.cat.rename_categories(stripped)
+				nulls = [c for c in stripped if c in NULL_VALUES_SET]
+				return values.cat.remove_categories(nulls) if nulls else values
+
+		# StringDtype conserva los nulos como pd.NA (no como el texto "nan")
+		# y .str.strip() es vectorizado; luego una sola máscara para
+		# vacíos, "nan", "None", etc. (NULL_VALUES de Config)
+		values = values.astype(_STRING_DTYPE).str.strip()
+		return values.mask(values.isin(NULL_VALUES_SET))
+
+	def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+		"""Limpia un chunk usando las listas de columnas precalculadas."""
+		# PASO 1: Limpiar columnas de texto
+		for col in self.text_columns:
+			df[col] = self._clean_text(df[col])
+
+		# PASO 2: Texto repetitivo (county/state) como category
+		for col in self.category_columns:
+			df[col] = df[col].astype("category")
+
+		# PASO 3: Parsear columnas de fecha
+		for col in self.date_columns:
+			try:
+				# Intentar convertir a datetime
+				# format: parser en C sin adivinar el formato (DATE_FORMAT
+				#   salvo que la columna tenga otro; None = inferir)
+				# cache=True: cada fecha distinta se parsea una sola vez
+				#   (hay ~1000 fechas repetidas en miles de condados)
+				# errors="coerce": Si falla, pone NaT (Not a Time = fecha inválida)
+				df[col] = pd.to_datetime(df[col], format=self.date_formats[col], errors="coerce", cache=True)
+			except Exception:
+				# Si falla completamente, dejar valores como están
+				# Esto evita que el script se detenga por un error
+				pass
+
+		return df
+
+
+def clean_chunk(
+	df: pd.DataFrame,
+	date_formats: Optional[dict[str, Optional[str]]] = None,
+	date_columns: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+	"""
+	🧹 LIMPIAR CHUNK - Limpia un bloque de datos suelto
+	
+	Atajo para limpiar un solo DataFrame: detecta sus columnas de texto y
+	fecha y aplica ChunkCleaner. Para muchos chunks con el mismo esquema,
+	crea un ChunkCleaner una vez y reutilízalo.
 	
 	Args:
 		df: DataFrame con un chunk de datos
+		date_formats: Formato fijo por columna de fecha (opcional; si no,
+			se detecta a partir del primer valor)
+		date_columns: Columnas de fecha ya conocidas (opcional; evita
+			revisar los nombres en cada llamada)
 		
 	Returns:
 		DataFrame limpio (mismo chunk, valores mejorados)
@@ -108,39 +617,316 @@ def clean_chunk(df: pd.DataFrame) -> pd.DataFrame:
 		0    Los Angeles
 		1    Miami
 	"""
-	# PASO 1: Limpiar columnas de texto (object = string en pandas)
-	# Seleccionar solo columnas de tipo texto
-	for col in df.select_dtypes(include=[object]).columns:
-		# Convertir a string (por si hay valores None)
-		df[col] = df[col].astype(str)
-		
-		# Quitar espacios al inicio/final de cada valor
-		df[col] = df[col].map(lambda s: s.strip() if s is not None else s)
-		
-		# Reemplazar valores vacíos o "nan" con NaN real de pandas
-		df[col] = df[col].replace({
-			"": pd.NA,      # Strings vacíos
-			"nan": pd.NA,   # Texto "nan"
-			"None": pd.NA   # Texto "None"
-		})
+	return ChunkCleaner.from_frame(df, date_formats, date_columns).apply(df)
 
-	# PASO 2: Parsear columnas de fecha
-	# Buscar columnas que tengan "date" en el nombre
-	for col in df.columns:
-		if "date" in col.lower():  # Buscar sin importar mayúsculas
-			try:
-				# Intentar convertir a datetime
-				# errors="coerce": Si falla, pone NaT (Not a Time = fecha inválida)
-				df[col] = pd.to_datetime(df[col], errors="coerce")
-			except Exception:
-				# Si falla completamente, dejar valores como están
-				# Esto evita que el script se detenga por un error
-				pass
 
-	return df
+def _prepare_chunk(
+	chunk: pd.DataFrame,
+	cleaner: ChunkCleaner,
+) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+	"""
+	Limpia un chunk y calcula el hash de cada fila y qué filas no están vacías.
+
+	Es una función de módulo (no lambda) para poder enviarla a procesos
+	trabajadores. Retorna el chunk, el hash uint64 de la clave
+	(DUPLICATE_SUBSET) de cada fila y una máscara de filas con al menos un
+	valor. Las filas vacías y los duplicados (locales y globales) se
+	descartan juntos en clean_csv, con un solo corte del chunk.
+	"""
+	chunk = cleaner.apply(chunk)
+
+	# Filas completamente vacías: solo se marcan (en lugar de dropna, que
+	# copiaría el chunk antes del corte final)
+	nonempty = chunk.notna().any(axis=1).to_numpy()
+
+	# Hash de cada fila: hash_pandas_object calcula un uint64 por fila de
+	# forma vectorizada (en C, columna a columna). Solo se hashean las
+	# columnas clave (DUPLICATE_SUBSET), no las 17 columnas.
+	keys = chunk[cleaner.key_columns] if cleaner.key_columns else chunk
+	hashes = hash_pandas_object(keys, index=False).to_numpy()
+	return chunk, hashes, nonempty
+
+
+def _iter_prepared_chunks(
+	chunks: Iterable[pd.DataFrame],
+	workers: int,
+) -> Iterator[tuple[pd.DataFrame, np.ndarray, np.ndarray]]:
+	"""
+	Aplica _prepare_chunk a cada chunk, en paralelo si workers > 1.
+
+	Los resultados salen en el MISMO orden de lectura. Como máximo hay
+	2 × workers chunks en vuelo, para no cargar el archivo entero en memoria.
+	"""
+	chunks = iter(chunks)
+	first = next(chunks, None)
+	if first is None:
+		return
+	# El esquema es el mismo en todos los chunks: el limpiador se arma una vez
+	cleaner = ChunkCleaner.from_frame(first)
+
+	if workers <= 1:
+		yield _prepare_chunk(first, cleaner)
+		for chunk in chunks:
+			yield _prepare_chunk(chunk, cleaner)
+		return
+
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		pending = deque([executor.submit(_prepare_chunk, first, cleaner)])
+		for chunk in chunks:
+			pending.append(executor.submit(_prepare_chunk, chunk, cleaner))
+			if len(pending) >= 2 * workers:
+				yield pending.popleft().result()
+		while pending:
+			yield pending.popleft().result()
+
+
+def _open_output(output_path: str, append: bool, compression: Optional[str]):
+	"""
+	Abre la salida en modo binario, comprimida si se pide.
+
+	Con "zstd" el compresor usa todos los núcleos (threads=-1) mientras
+	pandas formatea el siguiente chunk. En modo append se agrega un frame /
+	miembro nuevo al final, que pandas y zstd/gzip leen como uno solo.
+	"""
+	mode = "ab" if append else "wb"
+	if compression is None:
+		return open(output_path, mode, buffering=1 << 20)
+	if compression == "gzip":
+		return gzip.open(output_path, mode, compresslevel=min(OUTPUT_COMPRESSION_LEVEL, 9))
+	if compression == "zstd":
+		if zstd is None:
+			raise ImportError("compression='zstd' requiere instalar zstandard (pip install zstandard)")
+		compressor = zstd.ZstdCompressor(level=OUTPUT_COMPRESSION_LEVEL, threads=-1)
+		return compressor.stream_writer(open(output_path, mode))
+	raise ValueError(f"compression debe ser None, 'gzip' o 'zstd', no {compression!r}")
+
+
+def _write_csv_chunk(df: pd.DataFrame, out, header: bool) -> None:
+	"""
+	Escribe un chunk como CSV en un archivo binario ya abierto.
+
+	Usa write_csv_arrow (formatea en C++, ~5× más rápido que
+	DataFrame.to_csv, que es el paso más lento de clean_csv) con el mismo
+	texto que to_csv; si no está o alguna columna no se puede escribir con
+	Arrow, usa to_csv.
+	"""
+	if write_csv_arrow is None or not write_csv_arrow(df, out, header=header):
+		df.to_csv(out, header=header, index=False, encoding="utf-8")
 
 
-def clean_csv(input_path: str, output_path: str, chunk_size: int = 100_000, overwrite: bool = True) -> None:
+@contextmanager
+def _open_chunk_writer(
+	output_path: str,
+	append: bool,
+	compression: Optional[str],
+	output_format: str,
+):
+	"""
+	Abre la salida UNA vez y entrega una función write(df) para cada chunk.
+
+	- "csv": un solo handle (con buffer o comprimido); header solo al inicio
+	- "parquet": un ParquetWriter con el esquema del primer chunk; los
+	  siguientes se convierten a ese esquema (p. ej. índices de category)
+	"""
+	if output_format == "parquet":
+		if pq is None:
+			raise ImportError("output_format='parquet' requiere instalar pyarrow (pip install pyarrow)")
+		if append:
+			raise ValueError("Parquet no admite agregar a un archivo existente; usa overwrite=True")
+		writer = None
+
+		def write(df: pd.DataFrame) -> None:
+			nonlocal writer
+			table = pa.Table.from_pandas(df, preserve_index=False)
+			if writer is None:
+				writer = pq.ParquetWriter(output_path, table.schema, compression=compression or "zstd")
+			elif not table.schema.equals(writer.schema, check_metadata=False):
+				table = table.cast(writer.schema)
+			writer.write_table(table)
+
+		try:
+			yield write
+		finally:
+			if writer is not None:
+				writer.close()
+		return
+
+	if output_format != "csv":
+		raise ValueError(f"output_format debe ser 'csv' o 'parquet', no {output_format!r}")
+
+	header = not append
+	with _open_output(output_path, append, compression) as out:
+
+		def write(df: pd.DataFrame) -> None:
+			nonlocal header
+			_write_csv_chunk(df, out, header)
+			header = False
+
+		yield write
+
+
+# Bytes del inicio del archivo que entran a la huella (junto a tamaño y fecha)
+_FINGERPRINT_SAMPLE_BYTES = 64 * 1024
+
+
+def _fingerprint(input_path: str, output_path: str, options: dict) -> dict:
+	"""
+	Huella de una limpieza: entrada (tamaño, fecha de modificación y hash de
+	los primeros 64 KB), salida (tamaño y fecha) y opciones que cambian el
+	resultado. Si coincide con la guardada, la salida ya está al día.
+	"""
+	stat = os.stat(input_path)
+	with open(input_path, "rb") as f:
+		head = hashlib.blake2b(f.read(_FINGERPRINT_SAMPLE_BYTES)).hexdigest()
+	out_stat = os.stat(output_path) if os.path.exists(output_path) else None
+	return {
+		"input": [stat.st_size, stat.st_mtime_ns, head],
+		"output": [out_stat.st_size, out_stat.st_mtime_ns] if out_stat else None,
+		"options": options,
+	}
+
+
+def _load_fingerprint(path: str) -> Optional[dict]:
+	try:
+		with open(path, encoding="utf-8") as f:
+			return json.load(f)
+	except (OSError, ValueError):
+		return None
+
+
+def _clean_csv_polars(
+	input_path: str,
+	output_path: str,
+	append: bool,
+	compression: Optional[str] = None,
+	output_format: str = "csv",
+) -> None:
+	"""
+	Versión de clean_csv sobre el API lazy de Polars.
+
+	Aplica la misma limpieza que ChunkCleaner + _prepare_chunk como un solo
+	plan (LazyFrame) que Polars ejecuta en streaming y en varios hilos. Los
+	duplicados (por DUPLICATE_SUBSET) se eliminan de forma exacta,
+	conservando la primera aparición.
+	"""
+	use_columns, columns = _resolve_columns(input_path)
+	# Todo lo que no tenga tipo fijo se lee como texto (igual que object en pandas)
+	schema = {
+		raw: _POLARS_TYPES.get(READ_DTYPES.get(name), pl.String)
+		for raw, name in zip(use_columns, columns)
+	}
+	text_columns = [
+		name for raw, name in zip(use_columns, columns)
+		if schema[raw] == pl.String and "date" not in name.lower()
+	]
+	date_columns = [name for name in columns if "date" in name.lower()]
+	key_columns = list(DUPLICATE_SUBSET) if all(c in columns for c in DUPLICATE_SUBSET) else None
+
+	lf = (
+		pl.scan_csv(input_path, schema_overrides=schema, null_values=NULL_VALUES, infer_schema=False)
+		.select(use_columns)
+		.rename(dict(zip(use_columns, columns)))
+	)
+	lf = lf.with_columns(
+		[
+			pl.col(name).str.strip_chars().replace(NULL_VALUES, None)
+			for name in text_columns
+		]
+		+ [
+			pl.col(name).str.strip_chars().str.to_date(DATE_FORMAT, strict=False)
+			for name in date_columns
+		]
+		+ [
+			pl.col(name).cast(_POLARS_CASTS[READ_DTYPES[name]])
+			for name in columns
+			if READ_DTYPES.get(name) in _POLARS_CASTS
+		]
+	)
+	lf = (
+		lf.filter(~pl.all_horizontal(pl.all().is_null()))
+		.unique(subset=key_columns, keep="first", maintain_order=True)
+	)
+
+	if output_format == "parquet":
+		lf.sink_parquet(output_path, compression=compression or "zstd")
+	elif append or compression is not None:
+		with _open_output(output_path, append, compression) as out:
+			lf.collect(engine="streaming").write_csv(out, include_header=not append)
+	else:
+		lf.sink_csv(output_path)
+
+
+def _clean_csv_cudf(
+	input_path: str,
+	output_path: str,
+	append: bool,
+	compression: Optional[str] = None,
+	output_format: str = "csv",
+) -> None:
+	"""
+	Versión de clean_csv en GPU con cuDF.
+
+	Misma limpieza que ChunkCleaner + _prepare_chunk, pero con los kernels
+	de texto y fechas de cuDF sobre el archivo completo (cuDF no lee por
+	chunks: el archivo debe caber en la memoria de la GPU). El resultado
+	vuelve a pandas solo para escribirlo con el mismo escritor de siempre.
+	"""
+	use_columns, columns = _resolve_columns(input_path)
+	# Los enteros se leen como float (mismo truco que Arrow) y se
+	# convierten después; category y float32 se leen tal cual
+	dtypes = {}
+	int_dtypes = {}
+	for raw, name in zip(use_columns, columns):
+		dtype = READ_DTYPES.get(name)
+		if dtype is None:
+			continue
+		if dtype.startswith('Int'):
+			dtypes[raw] = 'float64'
+			int_dtypes[name] = dtype.lower()
+		else:
+			dtypes[raw] = dtype
+
+	df = cudf.read_csv(input_path, usecols=use_columns, dtype=dtypes, na_values=NULL_VALUES)
+	df.columns = columns
+
+	date_columns = [name for name in columns if "date" in name.lower()]
+	text_columns = [
+		name for name in df.select_dtypes(include=["object", "category"]).columns
+		if name not in date_columns
+	]
+	for name in text_columns:
+		values = df[name].astype("str").str.strip()
+		df[name] = values.where(~values.isin(NULL_VALUES))
+	for name in CATEGORICAL_COLUMNS:
+		if name in text_columns:
+			df[name] = df[name].astype("category")
+	for name in date_columns:
+		df[name] = cudf.to_datetime(df[name], format=DATE_FORMAT, errors="coerce")
+	df = df.astype(int_dtypes)
+
+	key_columns = list(DUPLICATE_SUBSET) if all(c in columns for c in DUPLICATE_SUBSET) else None
+	df = df.dropna(how="all").drop_duplicates(subset=key_columns, keep="first")
+	# drop_duplicates en GPU no garantiza el orden: volver al orden de lectura
+	df = df.sort_index()
+
+	with _open_chunk_writer(output_path, append, compression, output_format) as write:
+		write(df.to_pandas())
+
+
+def clean_csv(
+	input_path: str,
+	output_path: str,
+	chunk_size: int = 100_000,
+	overwrite: bool = True,
+	workers: Optional[int] = None,
+	exact_dedup: bool = False,
+	dedup_capacity: int = DEDUP_CAPACITY,
+	dedup_error_rate: float = DEDUP_ERROR_RATE,
+	engine: str = "pandas",
+	compression: Optional[str] = OUTPUT_COMPRESSION,
+	output_format: str = "csv",
+	skip_if_unchanged: bool = True,
+) -> None:
 	"""
 	🧹 LIMPIAR CSV - Función principal que limpia un archivo CSV completo
 	
@@ -155,11 +941,17 @@ def clean_csv(input_path: str, output_path: str, chunk_size: int = 100_000, over
 	   3. Lee chunk 3 (100k filas) → Limpia → Agrega al archivo
 	   ... y así hasta terminar el archivo
 	
+	   La limpieza de cada chunk (texto, vacíos, duplicados locales) se
+	   reparte entre `workers` procesos; el filtro de duplicados globales y
+	   la escritura se hacen en el proceso principal, en orden.
+	
 	✅ LO QUE HACE:
+	   - Lee con PyArrow si está instalado (multihilo), si no con pandas
 	   - Normaliza nombres de columnas (solo primera vez)
 	   - Limpia valores en cada chunk
 	   - Elimina filas completamente vacías
-	   - Elimina duplicados (dentro de cada chunk Y globalmente)
+	   - Elimina duplicados por clave DUPLICATE_SUBSET (dentro de cada
+	     chunk Y globalmente, con un filtro de Bloom de memoria acotada)
 	   - Guarda resultado en output_path
 	
 	Args:
@@ -167,6 +959,27 @@ def clean_csv(input_path: str, output_path: str, chunk_size: int = 100_000, over
 		output_path: Dónde guardar el CSV limpio (ej: "Output/cleaned.csv")
 		chunk_size: Cuántas filas procesar a la vez (default: 100,000)
 		overwrite: Si True, sobrescribe archivo existente
+		workers: Procesos para limpiar chunks en paralelo (None =
+			os.cpu_count() - 1, dejando un núcleo para leer y escribir;
+			1 = sin paralelismo)
+		exact_dedup: Si True, usa ExactHashSet (sin falsos positivos, más
+			memoria) en lugar del filtro de Bloom
+		dedup_capacity: Filas únicas esperadas por el filtro de Bloom antes
+			de crecer (default: DEDUP_CAPACITY)
+		dedup_error_rate: Tasa de falsos positivos del filtro de Bloom
+			(default: DEDUP_ERROR_RATE)
+		engine: "pandas" (chunks + procesos), "polars" (plan lazy en Rust,
+			requiere polars) o "cudf" (GPU, requiere RAPIDS cuDF); con
+			polars y cudf, workers y exact_dedup no aplican
+		compression: None, "gzip" o "zstd" (default: OUTPUT_COMPRESSION).
+			Se usa output_path tal cual; nómbralo .csv.gz / .csv.zst
+		output_format: "csv" o "parquet". Parquet (requiere pyarrow) guarda
+			los tipos ya limpios (fechas, enteros, category) sin pasarlos a
+			texto, y se lee mucho más rápido con pd.read_parquet; con
+			parquet, compression es el códec (None = "zstd")
+		skip_if_unchanged: Si True (y overwrite=True), guarda una huella en
+			output_path + ".fingerprint" y no repite la limpieza cuando la
+			entrada, la salida y las opciones no cambiaron desde la última vez
 		
 	Ejemplo:
 		>>> clean_csv("IntegratedData.csv", "Output/IntegratedData_cleaned.csv")
@@ -176,58 +989,125 @@ def clean_csv(input_path: str, output_path: str, chunk_size: int = 100_000, over
 		   ...
 		✅ Limpieza completada: Output/IntegratedData_cleaned.csv
 	"""
-	# Crear directorio de salida si no existe
+	# Crear directorio de salida si no existe (exist_ok=True ya cubre el caso
+	# en que existe, no hace falta consultarlo antes)
 	output_dir = os.path.dirname(output_path)
-	if output_dir and not os.path.exists(output_dir):
+	if output_dir:
 		os.makedirs(output_dir, exist_ok=True)
 
-	# Variables de control
-	first_chunk = True           # True solo para el primer chunk
-	seen_hashes = set()          # Para detectar duplicados globales
-
-	# Leer por chunks
-	for chunk in pd.read_csv(input_path, chunksize=chunk_size, low_memory=False):
-		if first_chunk:
-			# Normalizar nombres de columnas solo la primera vez
-			chunk.columns = [normalize_column_name(c) for c in chunk.columns]
-			header = True
-			first_chunk = False
-		else:
-			# Asegurar que columnas se alineen si hay discrepancias
-			chunk.columns = [normalize_column_name(c) for c in chunk.columns]
-			header = False
+	# - overwrite=True: se trunca y se escribe el header
+	# - overwrite=False y el archivo existe: se agrega al final sin header
+	append = not overwrite and os.path.exists(output_path)
 
-		chunk = clean_chunk(chunk)
+	# Re-ejecuciones: si la entrada, la salida y las opciones son las mismas
+	# que en la última limpieza, el resultado sería idéntico y no se repite.
+	# Al agregar (append) siempre se limpia.
+	fingerprint_path = output_path + ".fingerprint"
+	use_fingerprint = skip_if_unchanged and not append
+	if use_fingerprint:
+		options = {
+			"engine": engine,
+			"exact_dedup": exact_dedup,
+			"dedup_capacity": dedup_capacity,
+			"dedup_error_rate": dedup_error_rate,
+			"compression": compression,
+			"output_format": output_format,
+			"duplicate_subset": list(DUPLICATE_SUBSET),
+			"read_dtypes": READ_DTYPES,
+		}
+		saved = _load_fingerprint(fingerprint_path)
+		if (
+			saved is not None
+			and os.path.exists(output_path)
+			and saved == _fingerprint(input_path, output_path, options)
+		):
+			return
+		# Una limpieza interrumpida no debe dejar una huella válida
+		if os.path.exists(fingerprint_path):
+			os.remove(fingerprint_path)
 
-		# Eliminar filas completamente vacías
-		chunk = chunk.dropna(how="all")
+	_run_clean(
+		input_path,
+		output_path,
+		append,
+		chunk_size,
+		workers,
+		exact_dedup,
+		dedup_capacity,
+		dedup_error_rate,
+		engine,
+		compression,
+		output_format,
+	)
 
-		# Eliminar duplicados locales
-		chunk = chunk.drop_duplicates()
+	if use_fingerprint:
+		with open(fingerprint_path, "w", encoding="utf-8") as f:
+			json.dump(_fingerprint(input_path, output_path, options), f)
 
-		# Para evitar duplicados globales en un streaming simple, usamos hash de filas
-		# (puede consumir memoria según variedad de filas). Convertimos a tuplas.
-		hashes = chunk.apply(lambda row: tuple(row.values.tolist()), axis=1).map(hash)
-		mask = ~hashes.isin(seen_hashes)
-		if mask.any():
-			rows_to_write = chunk.loc[mask]
-			hashes_to_add = set(hashes[mask].tolist())
-			seen_hashes.update(hashes_to_add)
 
-			# Escribir al CSV (append tras el primer write)
-			if os.path.exists(output_path) and not overwrite:
-				rows_to_write.to_csv(output_path, mode="a", header=False, index=False)
+def _run_clean(
+	input_path: str,
+	output_path: str,
+	append: bool,
+	chunk_size: int,
+	workers: Optional[int],
+	exact_dedup: bool,
+	dedup_capacity: int,
+	dedup_error_rate: float,
+	engine: str,
+	compression: Optional[str],
+	output_format: str,
+) -> None:
+	"""Ejecuta la limpieza con el motor elegido (ver clean_csv)."""
+	if engine == "polars":
+		if pl is None:
+			raise ImportError("engine='polars' requiere instalar polars (pip install polars)")
+		_clean_csv_polars(input_path, output_path, append, compression, output_format)
+		return
+	if engine == "cudf":
+		if cudf is None:
+			raise ImportError("engine='cudf' requiere instalar RAPIDS cuDF y una GPU NVIDIA")
+		_clean_csv_cudf(input_path, output_path, append, compression, output_format)
+		return
+	if engine != "pandas":
+		raise ValueError(f"engine debe ser 'pandas', 'polars' o 'cudf', no {engine!r}")
+
+	if workers is None:
+		# El proceso principal lee, deduplica y escribe: se le deja un núcleo
+		workers = max(1, (os.cpu_count() or 1) - 1)
+
+	# Variables de control: hashes ya escritos (duplicados globales)
+	if exact_dedup:
+		seen_hashes = ExactHashSet()
+	else:
+		seen_hashes = ScalableBloomFilter(dedup_capacity, dedup_error_rate)
+
+	# El archivo de salida se abre UNA sola vez (con buffer de 1 MB, a través
+	# del compresor o como ParquetWriter) y cada chunk se escribe en el mismo
+	# handle: sin reabrir el archivo ni consultar si existe en cada iteración.
+	with _open_chunk_writer(output_path, append, compression, output_format) as write:
+		# Leer por chunks (columnas ya normalizadas por iter_csv_chunks) y
+		# limpiarlos en paralelo; los resultados llegan en orden de lectura
+		chunks = iter_csv_chunks(input_path, chunk_size)
+		for chunk, hashes, nonempty in _iter_prepared_chunks(chunks, workers):
+			# Para evitar duplicados globales en streaming, seen_hashes
+			# recuerda los hashes ya escritos y marca solo los nuevos (las
+			# filas vacías no entran ni al filtro ni a la salida)
+			if nonempty.all():
+				mask = seen_hashes.filter_new(hashes)
 			else:
-				# Si es la primera vez, sobreescribimos el archivo
-				if not os.path.exists(output_path):
-					rows_to_write.to_csv(output_path, mode="w", header=True, index=False)
-				else:
-					rows_to_write.to_csv(output_path, mode="a", header=False, index=False)
+				mask = nonempty.copy()
+				mask[nonempty] = seen_hashes.filter_new(hashes[nonempty])
+			if mask.any():
+				rows_to_write = chunk.loc[mask]
 
-	# Nota: si el dataset es muy grande, seen_hashes puede crecer mucho. Para
-	# datasets enormes se recomendaría una estrategia distinta (hash por columnas
-	# clave, base de datos temporal, o Bloom filter). Aquí aplicamos una solución
-	# práctica y sencilla que suele funcionar para tamaños moderados.
+				# Escribir el chunk (en CSV, header solo en la primera escritura)
+				write(rows_to_write)
+
+	# Nota: con exact_dedup=False, el filtro de Bloom usa ~34 bits por fila
+	# única (con la tasa de error por defecto) y crece por niveles si el
+	# archivo supera dedup_capacity. A cambio, una fila única puede
+	# descartarse con probabilidad dedup_error_rate.
 
 
 def main(argv: Optional[list[str]] = None) -> None:
@@ -236,14 +1116,33 @@ def main(argv: Optional[list[str]] = None) -> None:
 	parser.add_argument("--output", required=False, default="Output/IntegratedData_cleaned.csv", help="Ruta del CSV de salida")
 	parser.add_argument("--chunksize", type=int, default=100000, help="Tamaño de chunk para lectura (filas)")
 	parser.add_argument("--overwrite", action="store_true", help="Sobrescribir salida si existe")
+	parser.add_argument("--workers", type=int, default=None, help="Procesos para limpiar chunks (default: núcleos - 1; 1 = sin paralelismo)")
+	parser.add_argument("--dedup-capacity", type=int, default=DEDUP_CAPACITY, help="Filas únicas esperadas por el filtro de Bloom")
+	parser.add_argument("--dedup-fpr", type=float, default=DEDUP_ERROR_RATE, help="Tasa de falsos positivos del filtro de Bloom")
+	parser.add_argument("--exact-dedup", action="store_true", help="Deduplicación exacta (sin falsos positivos, más memoria)")
+	parser.add_argument("--compression", choices=["gzip", "zstd"], default=OUTPUT_COMPRESSION, help="Comprimir la salida (gzip o zstd)")
+	parser.add_argument("--format", dest="output_format", choices=["csv", "parquet"], default="csv", help="Formato de salida (parquet requiere pyarrow)")
+	parser.add_argument("--force", action="store_true", help="Limpiar aunque la entrada no haya cambiado desde la última vez")
+	parser.add_argument("--engine", choices=["pandas", "polars", "cudf"], default="pandas", help="Motor de limpieza (polars/cudf requieren tenerlos instalados; cudf usa la GPU)")
 
 	args = parser.parse_args(argv)
 
-	# Si overwrite no está puesto y el archivo existe, lo eliminamos para evitar append accidental
-	if args.overwrite and os.path.exists(args.output):
-		os.remove(args.output)
-
-	clean_csv(args.input, args.output, chunk_size=args.chunksize, overwrite=args.overwrite)
+	# Con --overwrite, clean_csv abre la salida en modo "w" (la trunca); sin
+	# él, agrega al final si ya existe
+	clean_csv(
+		args.input,
+		args.output,
+		chunk_size=args.chunksize,
+		overwrite=args.overwrite,
+		workers=args.workers,
+		exact_dedup=args.exact_dedup,
+		dedup_capacity=args.dedup_capacity,
+		dedup_error_rate=args.dedup_fpr,
+		engine=args.engine,
+		compression=args.compression,
+		output_format=args.output_format,
+		skip_if_unchanged=not args.force,
+	)
 
 
 if __name__ == "__main__":
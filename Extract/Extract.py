@@ -35,11 +35,16 @@ desde archivos CSV grandes de manera eficiente.
 
 from __future__ import annotations
 
+import csv
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Iterator
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
+from pandas.tseries.api import guess_datetime_format
 
 # ============================================================================
 # IMPORTAR CONFIGURACIONES
@@ -54,7 +59,9 @@ try:
         EXPECTED_COLUMNS,   # Qué columnas esperamos encontrar
         DATE_COLUMNS,       # Columnas de fecha (para parseo especial)
         NUMERIC_COLUMNS,    # Columnas numéricas
-        CATEGORICAL_COLUMNS # Columnas de texto
+        MOBILITY_COLUMNS,   # Columnas de movilidad (con muchos vacíos)
+        CATEGORICAL_COLUMNS,# Columnas de texto
+        READ_DTYPES         # Tipo fijo de cada columna al leer
     )
 except ImportError:
     # Si Config.py no existe, usar valores por defecto
@@ -63,7 +70,101 @@ except ImportError:
     EXPECTED_COLUMNS = None
     DATE_COLUMNS = ['date']
     NUMERIC_COLUMNS = []
+    MOBILITY_COLUMNS = []
     CATEGORICAL_COLUMNS = ['county', 'state']
+    READ_DTYPES = {}
+
+# PyArrow es opcional: si está instalado, extract_chunks lee con su lector
+# multihilo en C++; si no, con pd.read_csv por chunks
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pacsv = None
+    pq = None
+
+# Polars es opcional: extract_full(engine='polars') lo usa si está instalado
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Bytes aproximados por fila del CSV, para traducir chunk_size (filas) al
+# block_size (bytes) del lector de PyArrow
+_BYTES_PER_ROW_ESTIMATE = 128
+
+# Valores no nulos que se usan para deducir el formato de una columna de fecha
+_DATE_SAMPLE_SIZE = 64
+
+# Resolución de las columnas de fecha: PyArrow y Polars entregan [ms] y el
+# motor C [us]; todas se llevan a la misma para que los motores coincidan
+_DATE_DTYPE = np.dtype('datetime64[ms]')
+
+# Columna temporal con el número de fila en las lecturas con Polars
+_ROW_INDEX = '__row__'
+
+# Bytes del inicio del archivo que get_info pasa a PyArrow para ver el esquema
+_HEAD_SAMPLE_BYTES = 64 * 1024
+
+
+@lru_cache(maxsize=16)
+def _cached_header(path: str, size: int, mtime_ns: int) -> tuple:
+    """
+    Encabezado del CSV, memorizado por (ruta, tamaño, mtime): las llamadas
+    extract_* sobre el mismo archivo no lo vuelven a abrir, y si el archivo
+    cambia la clave cambia y se relee.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        return tuple(next(csv.reader(f), []))
+
+
+@lru_cache(maxsize=2)
+def _cached_table(path: str, size: int, mtime_ns: int) -> 'pa.Table':
+    """
+    CSV completo leído con pyarrow.csv.read_csv (multihilo), memorizado por
+    (ruta, tamaño, mtime) como _cached_header.
+    
+    La tabla de Arrow es inmutable, así que las lecturas siguientes del
+    mismo archivo solo la pasan a pandas, sin volver a parsear el CSV. La
+    caché guarda una referencia a las últimas 2 tablas (~el tamaño del CSV
+    cada una); DataExtractor.clear_cache() la libera.
+    """
+    header = _cached_header(path, size, mtime_ns)
+    column_types = {c: pa.float64() for c in MOBILITY_COLUMNS if c in header}
+    column_types.update({c: pa.date32() for c in DATE_COLUMNS if c in header})
+    return pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(column_types=column_types))
+
+
+@lru_cache(maxsize=64)
+def _infer_date_format(sample: tuple) -> Optional[str]:
+    """
+    Formato strftime común a los valores de la muestra, o None si no se
+    puede deducir o no coinciden (to_datetime lo infiere entonces solo).
+    """
+    formats = {guess_datetime_format(value) for value in sample}
+    if len(formats) == 1:
+        return formats.pop()
+    return None
+
+
+def _concat_chunks(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Une chunks conservando las columnas category (state, county).
+    
+    Cada chunk trae sus propias categorías; pd.concat con categorías
+    distintas pasa la columna a texto, así que antes se les asigna a todos
+    la unión de categorías.
+    """
+    if len(frames) > 1:
+        for col in frames[0].columns:
+            if isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+                categories = union_categoricals([f[col] for f in frames]).categories
+                frames = [f.assign(**{col: f[col].cat.set_categories(categories)}) for f in frames]
+    return pd.concat(frames)
 
 
 # ============================================================================
@@ -82,6 +183,8 @@ class DataExtractor:
     5. extract_by_state()     → Filtrado por estados
     6. extract_date_range()   → Filtrado por fechas
     7. get_info()            → Info del archivo sin cargar datos
+    8. extract_filtered()     → Estado + fechas en una sola pasada
+    9. extract_from_parquet() → Desde la copia Parquet (convert_to_parquet)
     """
     
     def __init__(self, file_path: str | Path = None, chunk_size: int = None):
@@ -108,7 +211,10 @@ class DataExtractor:
         self.columns = None      # Nombres de columnas del CSV
         self.dtypes = None       # Tipos de datos de cada columna
         
-    def validate_file(self) -> bool:
+        # Ruta ya validada (validate_file no repite el chequeo ni los mensajes)
+        self._validated_path = None
+        
+    def validate_file(self, force: bool = False) -> bool:
         """
         ✅ VALIDAR ARCHIVO - Verifica que el archivo exista y sea legible
         
@@ -117,6 +223,13 @@ class DataExtractor:
         2. Verifica que es un archivo (no un directorio)
         3. Calcula y muestra el tamaño en MB
         
+        Solo valida una vez por ruta: las siguientes llamadas (cada
+        extract_* la hace) retornan True sin stat() ni mensajes, salvo que
+        cambie file_path o se pase force=True.
+        
+        Args:
+            force: Si True, vuelve a validar aunque ya se haya hecho
+        
         Returns:
             True si todo está bien
             
@@ -130,6 +243,9 @@ class DataExtractor:
             📁 Archivo encontrado: datos.csv
             📊 Tamaño: 77.50 MB
         """
+        if not force and self._validated_path == self.file_path:
+            return True
+        
         # Paso 1: Verificar que existe
         if not self.file_path.exists():
             raise FileNotFoundError(f"Archivo no encontrado: {self.file_path}")
@@ -146,9 +262,10 @@ class DataExtractor:
         print(f"📁 Archivo encontrado: {self.file_path.name}")
         print(f"📊 Tamaño: {size_mb:.2f} MB")
         
+        self._validated_path = self.file_path
         return True
     
-    def extract_full(self, nrows: Optional[int] = None) -> pd.DataFrame:
+    def extract_full(self, nrows: Optional[int] = None, engine: str = 'pyarrow') -> pd.DataFrame:
         """
         📥 EXTRACCIÓN COMPLETA - Carga TODO el archivo en memoria
         
@@ -165,6 +282,11 @@ class DataExtractor:
             nrows: Número máximo de filas a leer
                   None = leer todas las filas
                   100 = solo primeras 100 filas (útil para pruebas)
+            engine: Lector del CSV
+                  'pyarrow' = multihilo en C++ (si PyArrow está instalado)
+                  'polars'  = lector de Polars (si está instalado)
+                  'c'       = motor C clásico de pandas
+                  Los tres producen los mismos tipos (READ_DTYPES)
             
         Returns:
             pd.DataFrame con todos los datos cargados
@@ -183,13 +305,11 @@ class DataExtractor:
         print(f"🔄 Extrayendo datos desde {self.file_path.name}...")
         
         try:
-            # Leer CSV con pandas
-            # low_memory=False: Lee todo de una vez (más RAM, más rápido)
-            df = pd.read_csv(
-                self.file_path,
-                nrows=nrows,          # Limitar filas si se especifica
-                low_memory=False      # Cargar todo en memoria
-            )
+            # Leer CSV con pandas, con tipos fijos (ver _read_csv)
+            if engine == 'polars' and pl is not None:
+                df = self._read_polars(nrows=nrows)
+            else:
+                df = self._read_csv(nrows=nrows, engine=engine)  # nrows: limitar filas si se especifica
             
             # Mostrar estadísticas de lo que se cargó
             print(f"✅ Datos extraídos exitosamente")
@@ -206,7 +326,7 @@ class DataExtractor:
             print(f"❌ Error al extraer datos: {e}")
             raise
     
-    def extract_chunks(self) -> Iterator[pd.DataFrame]:
+    def extract_chunks(self, arrow_dtypes: bool = False) -> Iterator[pd.DataFrame]:
         """
         📦 EXTRACCIÓN POR CHUNKS - Lee el archivo en bloques pequeños
         
@@ -218,10 +338,19 @@ class DataExtractor:
         💡 VENTAJA:
            - Usa poca memoria (solo un chunk a la vez)
            - Puede procesar archivos de 10GB+ con solo 2GB RAM
+           - Con PyArrow instalado, el CSV se tokeniza en C++ con varios
+             hilos y la columna date llega ya como fecha
         
         ⚠️ NOTA:
            - Es un GENERADOR (iterator), no retorna DataFrame directo
            - Debes iterar con un for loop
+           - Con PyArrow, cada chunk tiene ~chunk_size filas (Arrow corta
+             por bytes, no por filas)
+        
+        Args:
+            arrow_dtypes: Si True (y PyArrow está instalado), las columnas
+                          quedan como pd.ArrowDtype sobre los buffers de Arrow,
+                          sin copiarlas a NumPy ni convertirlas a READ_DTYPES
         
         Returns:
             Iterator que produce DataFrames de chunk_size filas cada uno
@@ -242,13 +371,7 @@ class DataExtractor:
         print(f"🔄 Extrayendo datos por chunks (tamaño: {self.chunk_size:,} filas)...")
         
         try:
-            chunk_iterator = pd.read_csv(
-                self.file_path,
-                chunksize=self.chunk_size,
-                low_memory=False
-            )
-            
-            for i, chunk in enumerate(chunk_iterator, 1):
+            for i, chunk in enumerate(self._iter_chunks(arrow_dtypes), 1):
                 print(f"   Chunk {i}: {len(chunk):,} filas", end='\r')
                 yield chunk
             
@@ -259,6 +382,173 @@ class DataExtractor:
             print(f"\n❌ Error al extraer chunks: {e}")
             raise
     
+    def _read_header(self) -> List[str]:
+        """Retorna los nombres de columnas (primera línea del CSV, en caché)."""
+        st = self.file_path.stat()
+        return list(_cached_header(str(self.file_path), st.st_size, st.st_mtime_ns))
+    
+    def _read_csv(self, columns: Optional[List[str]] = None, nrows: Optional[int] = None,
+                  chunksize: Optional[int] = None, engine: str = 'pyarrow'):
+        """
+        Lee el CSV con columnas y tipos fijos de Config, sin inferir tipos.
+        
+        - Columnas: las pedidas, o las de EXPECTED_COLUMNS que tenga el
+          archivo (si no tiene ninguna, todas)
+        - Tipos: READ_DTYPES (float32, enteros nullable, category)
+        - Fechas: DATE_COLUMNS como datetime
+        
+        Con PyArrow (y sin nrows/chunksize ni engine='c') lee la tabla de
+        Arrow del archivo, que queda en caché (_cached_table): leer de nuevo
+        el mismo archivo solo la pasa a pandas. Con el motor C, los enteros
+        se leen como float y se convierten después: el parser C es muy
+        lento con Int32 sobre valores como "4239.0".
+        
+        Returns:
+            DataFrame, o un iterador de DataFrames si se pasa chunksize
+        """
+        columns = self._select_columns(columns)
+        dtypes = {c: READ_DTYPES[c] for c in columns if c in READ_DTYPES}
+        dates = [c for c in DATE_COLUMNS if c in columns]
+        
+        if engine != 'c' and pa is not None and nrows is None and chunksize is None:
+            st = self.file_path.stat()
+            table = _cached_table(str(self.file_path), st.st_size, st.st_mtime_ns)
+            df = self._arrow_to_pandas(table.select(columns))
+            return self._parse_dates(df, dates)
+        
+        int_dtypes = {c: d for c, d in dtypes.items() if d.startswith('Int')}
+        reader = pd.read_csv(
+            self.file_path,
+            usecols=columns,
+            nrows=nrows,
+            chunksize=chunksize,
+            dtype={c: d for c, d in dtypes.items() if c not in int_dtypes},
+        )
+        if chunksize is None:
+            return self._parse_dates(reader.astype(int_dtypes), dates)
+        return (self._parse_dates(chunk.astype(int_dtypes), dates) for chunk in reader)
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Libera las tablas y encabezados de CSV guardados en caché."""
+        _cached_table.cache_clear()
+        _cached_header.cache_clear()
+    
+    def _select_columns(self, columns: Optional[List[str]] = None) -> List[str]:
+        """Columnas pedidas, o las de EXPECTED_COLUMNS que tenga el archivo (si no, todas)."""
+        if columns is not None:
+            return columns
+        header = self._read_header()
+        expected = set(EXPECTED_COLUMNS or [])
+        return [c for c in header if c in expected] or header
+    
+    def _read_polars(self, columns: Optional[List[str]] = None,
+                     nrows: Optional[int] = None,
+                     predicate: Optional['pl.Expr'] = None) -> pd.DataFrame:
+        """
+        Lee el CSV con `pl.scan_csv` (plan lazy: head(nrows) corta la
+        lectura) y lo pasa a pandas con los mismos tipos que _read_csv.
+        
+        Todo se lee como texto salvo los números (Float64; los enteros se
+        convierten al entero nullable de pandas después, como en _read_csv)
+        y las fechas, que se parsean en Polars. `predicate` se aplica dentro
+        del plan (Polars lo empuja al lector, en modo streaming) y el índice
+        conserva el número de fila del archivo, como en los chunks.
+        """
+        columns = self._select_columns(columns)
+        dtypes = {c: READ_DTYPES[c] for c in columns if c in READ_DTYPES}
+        dates = [c for c in DATE_COLUMNS if c in columns]
+        schema = {
+            c: pl.Float64 if READ_DTYPES.get(c, 'category') != 'category' else pl.String
+            for c in self._read_header()
+        }
+        lf = (
+            pl.scan_csv(self.file_path, schema_overrides=schema, infer_schema=False)
+            .with_row_index(_ROW_INDEX)
+            .select(_ROW_INDEX, *columns)
+            .with_columns(pl.col(c).str.to_date(strict=False) for c in dates)
+        )
+        if predicate is not None:
+            lf = lf.filter(predicate)
+        if nrows is not None:
+            lf = lf.head(nrows)
+        df = lf.collect(engine='streaming').to_pandas().astype(dtypes)
+        df.index = pd.Index(df.pop(_ROW_INDEX).to_numpy(dtype='int64'))
+        return self._parse_dates(df, dates)
+    
+    @staticmethod
+    def _parse_dates(df: pd.DataFrame, dates: List[str]) -> pd.DataFrame:
+        """
+        Convierte a datetime las columnas de fecha que aún no lo sean.
+        
+        El formato se deduce una vez de los primeros valores no nulos, así
+        to_datetime usa su parser en C de formato fijo (con cache=True, cada
+        fecha repetida se parsea una sola vez) en lugar de adivinar valor
+        por valor. Las fechas de numpy quedan en _DATE_DTYPE, sea cual sea
+        el motor que leyó el archivo.
+        """
+        for col in dates:
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                sample = tuple(df[col].dropna().head(_DATE_SAMPLE_SIZE).astype(str))
+                df[col] = pd.to_datetime(df[col], format=_infer_date_format(sample),
+                                         errors='coerce', cache=True)
+            dtype = df[col].dtype
+            if isinstance(dtype, np.dtype) and dtype.kind == 'M' and dtype != _DATE_DTYPE:
+                df[col] = df[col].astype(_DATE_DTYPE)
+        return df
+    
+    def _iter_chunks(self, arrow_dtypes: bool = False) -> Iterator[pd.DataFrame]:
+        """
+        Produce los chunks tipados del archivo, sin mensajes.
+        
+        Usa PyArrow si está instalado y si no pd.read_csv. En ambos casos el
+        índice sigue la numeración de filas del archivo (como read_csv).
+        """
+        if pacsv is None:
+            yield from self._read_csv(chunksize=self.chunk_size)
+            return
+        
+        offset = 0
+        for chunk in self._iter_arrow_chunks(arrow_dtypes):
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+    
+    def _iter_arrow_chunks(self, arrow_dtypes: bool = False) -> Iterator[pd.DataFrame]:
+        """
+        Lee el CSV con `pyarrow.csv.open_csv` (archivo mapeado en memoria) y
+        produce cada bloque como DataFrame de pandas.
+        
+        Arrow fija los tipos con el primer bloque, así que las columnas de
+        movilidad (que pueden venir vacías al principio) se fijan como
+        float64 y las de fecha como date32. Con arrow_dtypes=True cada
+        columna queda como pd.ArrowDtype (sin copia) en lugar de READ_DTYPES.
+        """
+        for batch in self._iter_arrow_batches():
+            yield self._arrow_to_pandas(batch, arrow_dtypes)
+    
+    def _iter_arrow_batches(self) -> Iterator['pa.RecordBatch']:
+        """Produce los RecordBatch de Arrow del CSV, sin pasarlos a pandas."""
+        header = self._read_header()
+        column_types = {c: pa.float64() for c in MOBILITY_COLUMNS if c in header}
+        column_types.update({c: pa.date32() for c in DATE_COLUMNS if c in header})
+        
+        read_options = pacsv.ReadOptions(
+            block_size=self.chunk_size * _BYTES_PER_ROW_ESTIMATE,
+            use_threads=True,
+        )
+        convert_options = pacsv.ConvertOptions(column_types=column_types)
+        with pa.memory_map(str(self.file_path), 'r') as source:
+            yield from pacsv.open_csv(source, read_options=read_options, convert_options=convert_options)
+    
+    @staticmethod
+    def _arrow_to_pandas(data, arrow_dtypes: bool = False) -> pd.DataFrame:
+        """Pasa un RecordBatch/Table a pandas con READ_DTYPES (o pd.ArrowDtype)."""
+        if arrow_dtypes:
+            return data.to_pandas(types_mapper=pd.ArrowDtype)
+        dtypes = {c: READ_DTYPES[c] for c in data.schema.names if c in READ_DTYPES}
+        return data.to_pandas(date_as_object=False).astype(dtypes)
+    
     def extract_columns(self, columns: List[str], nrows: Optional[int] = None) -> pd.DataFrame:
         """
         Extrae solo columnas específicas del dataset.
@@ -275,12 +565,7 @@ class DataExtractor:
         print(f"🔄 Extrayendo columnas específicas: {', '.join(columns)}")
         
         try:
-            df = pd.read_csv(
-                self.file_path,
-                usecols=columns,
-                nrows=nrows,
-                low_memory=False
-            )
+            df = self._read_csv(columns, nrows=nrows)
             
             print(f"✅ Columnas extraídas exitosamente")
             return df
@@ -289,30 +574,172 @@ class DataExtractor:
             print(f"❌ Error al extraer columnas: {e}")
             raise
     
-    def extract_sample(self, n: int = 1000, random: bool = True, seed: int = 42) -> pd.DataFrame:
+    def extract_sample(self, n: int = 1000, random: bool = True, seed: int = 42,
+                       frac: Optional[float] = None) -> pd.DataFrame:
         """
         Extrae una muestra del dataset.
         
+        La muestra aleatoria se toma con muestreo de reservorio (Algoritmo R)
+        mientras se leen los chunks: en memoria solo hay un chunk y las n
+        filas elegidas, nunca el archivo completo.
+        
         Args:
             n: Número de filas a extraer
             random: Si True, muestra aleatoria; si False, primeras n filas
             seed: Semilla para reproducibilidad (solo si random=True)
+            frac: Fracción de filas a extraer (ej. 0.1); si se indica,
+                  reemplaza a n
             
         Returns:
             DataFrame con la muestra
         """
+        if frac is not None:
+            n = int(round(frac * max(self._count_lines() - 1, 0)))
+        
         print(f"🔄 Extrayendo muestra ({'aleatoria' if random else 'secuencial'}) de {n:,} filas...")
         
         if random:
-            # Primero obtener el total de filas
-            df_full = self.extract_full()
-            df_sample = df_full.sample(n=min(n, len(df_full)), random_state=seed)
+            self.validate_file()
+            df_sample = self._reservoir_sample(n, seed)
         else:
             df_sample = self.extract_full(nrows=n)
         
         print(f"✅ Muestra extraída: {len(df_sample):,} filas")
         return df_sample
     
+    def _reservoir_sample(self, n: int, seed: int) -> pd.DataFrame:
+        """
+        Muestreo de reservorio vectorizado por chunk.
+        
+        La fila i (0-based) ocupa el slot i si i < n; si no, entra con
+        probabilidad n/(i+1) en un slot al azar. `slots` guarda qué fila
+        (índice global) hay en cada slot y `pool` las filas que aún están.
+        """
+        rng = np.random.default_rng(seed)
+        slots = np.full(n, -1, dtype=np.int64)
+        pool = None
+        seen = 0
+        
+        for chunk in self._iter_chunks():
+            positions = np.arange(seen, seen + len(chunk))
+            seen += len(chunk)
+            draws = np.where(positions < n, positions, rng.integers(0, positions + 1))
+            take = draws < n
+            # Con slots repetidos en el mismo chunk gana la última fila (igual
+            # que en el algoritmo fila por fila)
+            slots[draws[take]] = positions[take]
+            
+            # Solo las filas de este chunk que entraron a algún slot se unen
+            # al pool (no el chunk completo)
+            taken = chunk.iloc[np.flatnonzero(take)]
+            candidates = taken if pool is None else _concat_chunks([pool, taken])
+            pool = candidates[candidates.index.isin(slots)]
+        
+        if pool is None:
+            return pd.DataFrame()
+        return pool.loc[slots[slots >= 0]]
+    
+    def _count_lines(self) -> int:
+        """
+        Cuenta las líneas del archivo leyendo bloques de 1 MB en binario.
+        
+        bytearray.count(b'\n') recorre cada bloque en C con memchr (como
+        `wc -l`), en lugar de crear un string de Python por cada línea; el
+        mismo buffer se reutiliza con readinto, sin crear un bytes por bloque.
+        """
+        total = 0
+        last = 0
+        buf = bytearray(1 << 20)
+        with open(self.file_path, 'rb', buffering=0) as f:
+            while n := f.readinto(buf):
+                total += buf.count(b'\n', 0, n)
+                last = buf[n - 1]
+        # La última línea cuenta aunque no termine en salto de línea
+        if last and last != ord('\n'):
+            total += 1
+        return total
+    
+    def _parquet_path(self) -> Path:
+        """El propio archivo si ya es .parquet; si no, su copia hermana .parquet."""
+        if self.file_path.suffix == '.parquet':
+            return self.file_path
+        return self.file_path.with_suffix('.parquet')
+    
+    def convert_to_parquet(self, overwrite: bool = False) -> Path:
+        """
+        Guarda una copia Parquet del CSV junto a él (mismo nombre, .parquet).
+        
+        Se escribe un row group por bloque de Arrow, con estadísticas
+        min/max por columna: extract_from_parquet usa esas estadísticas para
+        saltarse los row groups que no cumplen los filtros. Si la copia ya
+        existe y es más nueva que el CSV, no se vuelve a escribir.
+        
+        Args:
+            overwrite: Si True, la reescribe aunque esté al día
+            
+        Returns:
+            Path de la copia Parquet
+        """
+        if pq is None:
+            raise ImportError("convert_to_parquet requiere pyarrow")
+        self.validate_file()
+        
+        parquet_path = self._parquet_path()
+        if (not overwrite and parquet_path.exists()
+                and parquet_path.stat().st_mtime_ns >= self.file_path.stat().st_mtime_ns):
+            return parquet_path
+        
+        print(f"🔄 Convirtiendo {self.file_path.name} a Parquet...")
+        writer = None
+        try:
+            for batch in self._iter_arrow_batches():
+                if writer is None:
+                    writer = pq.ParquetWriter(parquet_path, batch.schema, compression='zstd')
+                writer.write_batch(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        size_mb = parquet_path.stat().st_size / (1024 * 1024)
+        print(f"✅ Parquet guardado: {parquet_path.name} ({size_mb:.2f} MB)")
+        return parquet_path
+    
+    def extract_from_parquet(self, columns: Optional[List[str]] = None,
+                             filters: Optional[list] = None,
+                             state: Optional[str] = None,
+                             start_date: Optional[str] = None,
+                             end_date: Optional[str] = None) -> pd.DataFrame:
+        """
+        Extrae datos desde la copia Parquet (ver convert_to_parquet; se crea
+        si no existe), leyendo solo las columnas pedidas y saltando los row
+        groups que los filtros descartan por sus estadísticas.
+        
+        Args:
+            columns: Columnas a leer (None = todas)
+            filters: Filtros de pyarrow, ej. [('fips', '=', 6037)]
+            state: Estado a filtrar (se compara en minúsculas, como en el CSV)
+            start_date: Fecha inicio YYYY-MM-DD
+            end_date: Fecha fin YYYY-MM-DD
+            
+        Returns:
+            DataFrame con los mismos tipos que extract_full
+        """
+        parquet_path = self.convert_to_parquet()
+        
+        filters = list(filters or [])
+        if state:
+            filters.append(('state', '=', state.lower()))
+        if start_date:
+            filters.append(('date', '>=', pd.Timestamp(start_date).date()))
+        if end_date:
+            filters.append(('date', '<=', pd.Timestamp(end_date).date()))
+        
+        table = pq.read_table(parquet_path, columns=columns, filters=filters or None)
+        df = self._arrow_to_pandas(table)
+        
+        print(f"✅ Datos extraídos desde Parquet: {len(df):,} filas")
+        return df
+    
     def get_info(self) -> dict:
         """
         Obtiene información básica del archivo sin cargar todos los datos.
@@ -322,26 +749,58 @@ class DataExtractor:
         """
         self.validate_file()
         
-        # Leer solo las primeras filas para obtener columnas
-        df_head = pd.read_csv(self.file_path, nrows=5)
+        # Leer solo el inicio del archivo para obtener columnas y tipos
+        # (con PyArrow, tipos de Arrow; si no, dtypes de pandas)
+        if pa is not None:
+            schema = self._read_head_schema()
+            columns = schema.names
+            dtypes = {field.name: field.type for field in schema}
+        else:
+            df_head = self._read_csv(nrows=5)
+            columns = df_head.columns.tolist()
+            dtypes = df_head.dtypes.to_dict()
         
         # Contar líneas del archivo
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            total_lines = sum(1 for _ in f) - 1  # -1 por el header
+        total_lines = self._count_lines() - 1  # -1 por el header
         
         return {
             'file_path': str(self.file_path),
             'file_size_mb': self.file_path.stat().st_size / (1024 * 1024),
             'total_rows': total_lines,
-            'total_columns': len(df_head.columns),
-            'columns': df_head.columns.tolist(),
-            'dtypes': df_head.dtypes.to_dict()
+            'total_columns': len(columns),
+            'columns': columns,
+            'dtypes': dtypes
         }
     
+    def _read_head_schema(self) -> 'pa.Schema':
+        """
+        Lee los primeros _HEAD_SAMPLE_BYTES del CSV con PyArrow (cortando
+        en el último salto de línea completo) y retorna su esquema, con los
+        mismos tipos fijos que _iter_arrow_chunks.
+        """
+        with open(self.file_path, 'rb') as f:
+            data = f.read(_HEAD_SAMPLE_BYTES)
+        if len(data) == _HEAD_SAMPLE_BYTES and b'\n' in data:
+            data = data[:data.rfind(b'\n') + 1]
+        
+        header = self._read_header()
+        column_types = {c: pa.float64() for c in MOBILITY_COLUMNS if c in header}
+        column_types.update({c: pa.date32() for c in DATE_COLUMNS if c in header})
+        table = pacsv.read_csv(
+            pa.BufferReader(data),
+            convert_options=pacsv.ConvertOptions(column_types=column_types),
+        )
+        return table.schema
+    
     def extract_by_state(self, state: str, nrows: Optional[int] = None) -> pd.DataFrame:
         """
         Extrae datos filtrados por estado específico.
         
+        Lee el archivo por chunks y conserva solo las filas del estado
+        (sin cargar el archivo completo en memoria). Con PyArrow el filtro
+        se hace sobre cada RecordBatch con pyarrow.compute, y solo las filas
+        del estado se pasan a pandas.
+        
         Args:
             state: Nombre del estado a filtrar
             nrows: Límite de filas a procesar (None = todas)
@@ -350,17 +809,88 @@ class DataExtractor:
             DataFrame filtrado por estado
         """
         print(f"🔄 Extrayendo datos para el estado: {state}")
+        self.validate_file()
         
-        df = self.extract_full(nrows=nrows)
-        df_filtered = df[df['state'].str.lower() == state.lower()].copy()
+        target = state.lower()
+        if pc is not None:
+            df_filtered = self._filter_arrow_by_state(target, nrows)
+            print(f"✅ Datos extraídos: {len(df_filtered):,} filas para {state}")
+            return df_filtered
+        
+        parts = []
+        empty = None
+        processed = 0
+        for chunk in self._iter_chunks():
+            if nrows is not None:
+                chunk = chunk.iloc[:nrows - processed]
+            processed += len(chunk)
+            
+            mask = self._state_mask(chunk['state'], target)
+            if mask.any():
+                parts.append(chunk[mask])
+            elif empty is None:
+                empty = chunk.iloc[:0]
+            
+            if nrows is not None and processed >= nrows:
+                break
+        
+        df_filtered = _concat_chunks(parts) if parts else empty
         
         print(f"✅ Datos extraídos: {len(df_filtered):,} filas para {state}")
         return df_filtered
     
+    @staticmethod
+    def _state_mask(states: pd.Series, target: str) -> pd.Series:
+        """Máscara de las filas cuyo estado (sin mayúsculas) es target."""
+        if isinstance(states.dtype, pd.CategoricalDtype):
+            # state es category: se pasan a minúsculas solo las ~50
+            # categorías y se comparan los códigos enteros de cada fila
+            codes = [i for i, c in enumerate(states.cat.categories) if str(c).lower() == target]
+            return states.cat.codes.isin(codes)
+        return states.str.lower() == target
+    
+    def _filter_arrow_by_state(self, target: str, nrows: Optional[int] = None) -> pd.DataFrame:
+        """
+        Filtra por estado (ya en minúsculas) cada RecordBatch con kernels de
+        pyarrow.compute y pasa a pandas solo las filas que quedan. El índice
+        conserva el número de fila del archivo, como en los chunks.
+        """
+        kept = []
+        rows = []
+        schema = None
+        processed = 0
+        for batch in self._iter_arrow_batches():
+            if nrows is not None:
+                batch = batch.slice(0, nrows - processed)
+            schema = batch.schema
+            
+            mask = pc.equal(pc.utf8_lower(batch.column('state')), target)
+            mask = pc.fill_null(mask, False)
+            positions = np.flatnonzero(mask.to_numpy(zero_copy_only=False))
+            if len(positions):
+                kept.append(batch.filter(mask))
+                rows.append(positions + processed)
+            processed += batch.num_rows
+            
+            if nrows is not None and processed >= nrows:
+                break
+        
+        if schema is None:
+            return pd.DataFrame()
+        table = pa.Table.from_batches(kept, schema=schema)
+        df = self._arrow_to_pandas(table)
+        df.index = pd.Index(np.concatenate(rows) if rows else np.empty(0, dtype=np.int64))
+        return df
+    
     def extract_date_range(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
         Extrae datos para un rango de fechas específico.
         
+        Con Polars, el filtro se empuja al lector (`pl.scan_csv` lazy); si
+        no, lee el archivo por chunks y conserva solo las filas del rango.
+        En ambos casos la memoria depende del resultado y no del tamaño del
+        archivo.
+        
         Args:
             start_date: Fecha inicio (formato YYYY-MM-DD)
             end_date: Fecha fin (formato YYYY-MM-DD)
@@ -369,12 +899,91 @@ class DataExtractor:
             DataFrame filtrado por rango de fechas
         """
         print(f"🔄 Extrayendo datos del {start_date} al {end_date}")
+        self.validate_file()
+        
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date)
         
-        df = self.extract_full()
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
+        if pl is not None:
+            # Con Polars el filtro va dentro del plan de lectura
+            date = pl.col('date')
+            df_filtered = self._read_polars(predicate=(date >= start.date()) & (date <= end.date()))
+            print(f"✅ Datos extraídos: {len(df_filtered):,} filas")
+            return df_filtered
+        
+        # Filtrar chunk por chunk (la columna date ya llega como datetime):
+        # en memoria solo quedan un chunk y las filas del rango
+        parts = []
+        empty = None
+        for chunk in self._iter_chunks():
+            mask = (chunk['date'] >= start) & (chunk['date'] <= end)
+            if mask.any():
+                parts.append(chunk[mask])
+            elif empty is None:
+                empty = chunk.iloc[:0]
+        
+        df_filtered = _concat_chunks(parts) if parts else empty
+        
+        print(f"✅ Datos extraídos: {len(df_filtered):,} filas")
+        return df_filtered
+    
+    def extract_filtered(self, state: Optional[str] = None,
+                         start_date: Optional[str] = None,
+                         end_date: Optional[str] = None) -> pd.DataFrame:
+        """
+        Extrae las filas que cumplen TODOS los filtros indicados (estado y/o
+        rango de fechas) en una sola pasada por el archivo.
+        
+        Equivale a combinar extract_by_state y extract_date_range, pero sin
+        leer el archivo dos veces: con Polars los filtros van juntos en un
+        solo plan lazy (empujados al lector); si no, se aplican juntos a
+        cada chunk.
+        
+        Args:
+            state: Estado a filtrar (None = todos)
+            start_date: Fecha inicio YYYY-MM-DD (None = sin límite)
+            end_date: Fecha fin YYYY-MM-DD (None = sin límite)
+            
+        Returns:
+            DataFrame filtrado
+        """
+        print(f"🔄 Extrayendo datos filtrados (estado={state}, desde={start_date}, hasta={end_date})")
+        self.validate_file()
+        
+        target = state.lower() if state else None
+        start = pd.Timestamp(start_date) if start_date else None
+        end = pd.Timestamp(end_date) if end_date else None
+        
+        if pl is not None:
+            predicates = []
+            if target is not None:
+                predicates.append(pl.col('state').str.to_lowercase() == target)
+            if start is not None:
+                predicates.append(pl.col('date') >= start.date())
+            if end is not None:
+                predicates.append(pl.col('date') <= end.date())
+            predicate = pl.all_horizontal(predicates) if predicates else None
+            df_filtered = self._read_polars(predicate=predicate)
+            print(f"✅ Datos extraídos: {len(df_filtered):,} filas")
+            return df_filtered
+        
+        parts = []
+        empty = None
+        for chunk in self._iter_chunks():
+            mask = pd.Series(True, index=chunk.index)
+            if target is not None:
+                mask &= self._state_mask(chunk['state'], target)
+            if start is not None:
+                mask &= chunk['date'] >= start
+            if end is not None:
+                mask &= chunk['date'] <= end
+            
+            if mask.any():
+                parts.append(chunk[mask])
+            elif empty is None:
+                empty = chunk.iloc[:0]
         
-        mask = (df['date'] >= start_date) & (df['date'] <= end_date)
-        df_filtered = df[mask].copy()
+        df_filtered = _concat_chunks(parts) if parts else empty
         
         print(f"✅ Datos extraídos: {len(df_filtered):,} filas")
         return df_filtered
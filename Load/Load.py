@@ -42,10 +42,17 @@ los datos procesados en disco para uso posterior.
 
 from __future__ import annotations
 
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
+import csv
+import io
 import json
+import logging
+import os
+import shutil
 from datetime import datetime
 
 # ============================================================================
@@ -59,6 +66,172 @@ except ImportError:
     FIGURES_DIR = OUTPUT_DIR / "figures"
     CHUNK_SIZE = 100_000
 
+# PyArrow es opcional: si está instalado, Parquet es el formato por defecto
+# de save_data (columnar, comprimido y sin convertir cada valor a texto)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pc = None
+    pacsv = None
+
+_DEFAULT_FORMAT = 'parquet' if pa is not None else 'csv'
+
+# orjson es opcional: serializa JSON en Rust (con indentación incluida)
+# varias veces más rápido que json; si no está, se usa json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# XlsxWriter es opcional: en modo constant_memory escribe cada fila directo
+# al XML de la hoja, en lugar de armar todas las celdas en memoria (openpyxl)
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+
+logger = logging.getLogger(__name__)
+
+# Filas por bloque al revisar una columna completa antes de escribirla
+_CSV_CHECK_BLOCK = 1_000_000
+
+
+# ============================================================================
+# CSV CON PYARROW
+# ============================================================================
+
+def _blocks(series: pd.Series):
+    """La serie en bloques de _CSV_CHECK_BLOCK filas (vistas, sin copiar)."""
+    for start in range(0, len(series), _CSV_CHECK_BLOCK):
+        yield series.iloc[start:start + _CSV_CHECK_BLOCK]
+
+
+def _csv_column_kind(series: pd.Series) -> Optional[str]:
+    """
+    Cómo escribir una columna con Arrow para obtener el mismo texto que
+    to_csv, o None si Arrow no puede (to_csv escribe el DataFrame).
+    
+    - 'plain': enteros y texto, tal cual
+    - 'bool': "True"/"False" (Arrow escribe "true"/"false")
+    - 'category': valores decodificados (Arrow los escribe como texto)
+    - 'float': floats sin decimales, como entero + ".0" (Arrow omite el
+      ".0" y usa otra notación científica que repr)
+    - 'date': fechas sin hora, como YYYY-MM-DD (igual que pandas cuando
+      ningún valor tiene hora)
+    - 'null': columna object toda vacía
+    """
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'bool'
+    if isinstance(dtype, pd.CategoricalDtype):
+        values_type = pa.infer_type(dtype.categories, from_pandas=True)
+        if pa.types.is_integer(values_type) or pa.types.is_string(values_type):
+            return 'category'
+        return None
+    if pd.api.types.is_integer_dtype(dtype):
+        return 'plain'
+    if pd.api.types.is_float_dtype(dtype):
+        for block in _blocks(series):
+            v = block.to_numpy(dtype='float64', na_value=np.nan)
+            # Enteros exactos: |v| < 1e16 (repr no usa exponente) y sin -0.0
+            whole = (v == np.trunc(v)) & (np.abs(v) < 1e16) & ~((v == 0) & np.signbit(v))
+            if not (np.isnan(v) | whole).all():
+                return None
+        return 'float'
+    if isinstance(dtype, np.dtype) and dtype.kind == 'M':
+        per_day = np.timedelta64(1, 'D') // np.timedelta64(1, np.datetime_data(dtype)[0])
+        nat = np.iinfo(np.int64).min
+        for block in _blocks(series):
+            v = block.to_numpy().view('i8')
+            if not ((v == nat) | (v % per_day == 0)).all():
+                return None
+        return 'date'
+    if pd.api.types.is_string_dtype(dtype):
+        values_type = pa.infer_type(series, from_pandas=True)
+        if pa.types.is_string(values_type) or pa.types.is_large_string(values_type):
+            return 'plain'
+        if pa.types.is_null(values_type):
+            return 'null'
+    return None
+
+
+def _csv_column_array(series: pd.Series, kind: str):
+    """Arreglo de Arrow de la columna, listo para pyarrow.csv (ver _csv_column_kind)."""
+    array = pa.array(series, from_pandas=True)
+    if kind == 'bool':
+        return pc.if_else(array, 'True', 'False')
+    if kind == 'category':
+        return array.dictionary_decode()
+    if kind == 'float':
+        text = pc.cast(pc.cast(array, pa.int64()), pa.string())
+        return pc.binary_join_element_wise(text, '0', '.')
+    if kind == 'date':
+        return pc.cast(array, pa.date32())
+    if kind == 'null':
+        return pa.nulls(len(array), pa.string())
+    return array
+
+
+def write_csv_arrow(df: pd.DataFrame,
+                    out,
+                    header: bool = True,
+                    chunk_size: Optional[int] = None,
+                    on_chunk=None) -> bool:
+    """
+    Escribe df como CSV en un archivo binario abierto con pyarrow.csv, con
+    el mismo texto que df.to_csv(index=False).
+    
+    Arrow formatea en C++ (varias veces más rápido que to_csv), pero no
+    escribe todos los tipos igual que pandas: cada columna se convierte
+    antes (ver _csv_column_kind). Si alguna no se puede (floats con
+    decimales, fechas con hora, objetos mixtos...) no escribe nada y
+    retorna False para que el llamador use to_csv. Cada chunk se convierte
+    a Arrow por separado (memoria acotada al chunk); un chunk con comas,
+    comillas o saltos de línea en el texto se escribe con to_csv (mismo
+    formato, con comillas solo donde hacen falta).
+    
+    Args:
+        df: DataFrame a escribir (el índice no se escribe)
+        out: Archivo binario abierto
+        header: Si escribir la fila de nombres de columnas
+        chunk_size: Filas por chunk (None = todo de una vez)
+        on_chunk: Función opcional on_chunk(i, filas) tras cada chunk
+        
+    Returns:
+        True si escribió df, False si hay que usar to_csv
+    """
+    # Con una sola columna to_csv escribe los vacíos como ""
+    if pacsv is None or len(df.columns) < 2:
+        return False
+    kinds = [_csv_column_kind(df.iloc[:, j]) for j in range(len(df.columns))]
+    if None in kinds:
+        return False
+    
+    if header:
+        # csv.writer pone comillas solo donde hacen falta, como to_csv
+        text = io.StringIO()
+        csv.writer(text, lineterminator='\n').writerow(df.columns)
+        out.write(text.getvalue().encode('utf-8'))
+    
+    options = pacsv.WriteOptions(include_header=False, quoting_style='none')
+    names = [str(name) for name in df.columns]
+    chunk_size = chunk_size or max(len(df), 1)
+    for i, start in enumerate(range(0, len(df), chunk_size)):
+        chunk = df.iloc[start:start + chunk_size]
+        arrays = [_csv_column_array(chunk.iloc[:, j], kind) for j, kind in enumerate(kinds)]
+        try:
+            pacsv.write_csv(pa.Table.from_arrays(arrays, names=names), out, options)
+        except pa.ArrowInvalid:
+            # Texto que necesita comillas: quoting_style='none' no lo acepta
+            out.write(chunk.to_csv(index=False, header=False, lineterminator='\n').encode('utf-8'))
+        if on_chunk is not None:
+            on_chunk(i, len(chunk))
+    return True
+
 
 # ============================================================================
 # CLASE PRINCIPAL: DataLoader
@@ -70,6 +243,9 @@ class DataLoader:
     
     Esta clase facilita:
     - Guardar datos procesados (CSV, Excel, JSON, Parquet)
+      → Parquet es el recomendado para datos intermedios: se escribe
+        directo desde buffers columnares, sin pasar cada valor a texto,
+        y ocupa varias veces menos que el CSV
     - Cargar datos guardados
     - Crear backups con timestamp
     - Gestionar metadatos
@@ -82,7 +258,7 @@ class DataLoader:
         
         Args:
             output_dir: Dónde guardar archivos (default: Output/)
-                       Si no existe, lo crea automáticamente
+                       Si no existe, se crea al guardar el primer archivo
         
         Ejemplo:
             >>> loader = DataLoader()  # Usa Output/
@@ -91,10 +267,17 @@ class DataLoader:
         # Usar OUTPUT_DIR de Config.py si no se especifica
         self.output_dir = Path(output_dir) if output_dir else OUTPUT_DIR
         
-        # Crear directorio si no existe
-        # parents=True: crea directorios padres también
-        # exist_ok=True: no da error si ya existe
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # El directorio se crea recién en el primer save_* (_ensure_dir):
+        # cargar o listar no necesita crearlo
+        self._dir_ready = False
+    
+    def _ensure_dir(self) -> None:
+        """Crea el directorio de salida la primera vez que se guarda algo."""
+        if not self._dir_ready:
+            # parents=True: crea directorios padres también
+            # exist_ok=True: no da error si ya existe
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
     
     def save_to_csv(self, 
                     df: pd.DataFrame, 
@@ -130,6 +313,7 @@ class DataLoader:
         if not filename.endswith('.csv'):
             filename += '.csv'
         
+        self._ensure_dir()
         filepath = self.output_dir / filename
         df.to_csv(filepath, index=index, **kwargs)
         
@@ -145,6 +329,11 @@ class DataLoader:
         """
         Guarda DataFrame a CSV en chunks (para archivos grandes).
         
+        El archivo se abre una sola vez. Con PyArrow (e index=False) se
+        escribe con write_csv_arrow, que formatea en C++; si no, o si alguna
+        columna no se puede escribir con Arrow, usa to_csv. En ambos casos el
+        archivo es idéntico al de save_to_csv.
+        
         Args:
             df: DataFrame a guardar
             filename: Nombre del archivo
@@ -159,15 +348,19 @@ class DataLoader:
         if not filename.endswith('.csv'):
             filename += '.csv'
         
+        self._ensure_dir()
         filepath = self.output_dir / filename
         
+        def report(i, rows):
+            print(f"  Chunk {i+1}: {rows:,} filas guardadas")
+        
         # Guardar en chunks
-        for i, start in enumerate(range(0, len(df), chunk_size)):
-            chunk = df.iloc[start:start + chunk_size]
-            mode = 'w' if i == 0 else 'a'
-            header = i == 0
-            chunk.to_csv(filepath, mode=mode, header=header, index=index)
-            print(f"  Chunk {i+1}: {len(chunk):,} filas guardadas")
+        with open(filepath, 'wb') as f:
+            if index or not write_csv_arrow(df, f, chunk_size=chunk_size, on_chunk=report):
+                for i, start in enumerate(range(0, len(df), chunk_size)):
+                    chunk = df.iloc[start:start + chunk_size]
+                    chunk.to_csv(f, header=i == 0, index=index, encoding='utf-8')
+                    report(i, len(chunk))
         
         size_mb = filepath.stat().st_size / (1024 * 1024)
         print(f"✅ CSV guardado (chunked): {filepath.name} ({size_mb:.2f} MB)")
@@ -181,6 +374,9 @@ class DataLoader:
         """
         Guarda DataFrame a archivo Excel.
         
+        Con XlsxWriter instalado usa su modo constant_memory (memoria
+        constante, fila por fila); si no, el motor por defecto de pandas.
+        
         Args:
             df: DataFrame a guardar
             filename: Nombre del archivo
@@ -193,8 +389,15 @@ class DataLoader:
         if not filename.endswith('.xlsx'):
             filename += '.xlsx'
         
+        self._ensure_dir()
         filepath = self.output_dir / filename
-        df.to_excel(filepath, sheet_name=sheet_name, index=index)
+        if xlsxwriter is not None:
+            with pd.ExcelWriter(filepath, engine='xlsxwriter',
+                                engine_kwargs={'options': {'constant_memory': True}}) as writer:
+                df.to_excel(writer, sheet_name=sheet_name, index=index)
+        else:
+            print("⚠️ XlsxWriter no está instalado; se usa el motor por defecto (más lento)")
+            df.to_excel(filepath, sheet_name=sheet_name, index=index)
         
         size_mb = filepath.stat().st_size / (1024 * 1024)
         print(f"✅ Excel guardado: {filepath.name} ({size_mb:.2f} MB)")
@@ -208,6 +411,10 @@ class DataLoader:
         """
         Guarda DataFrame a archivo JSON.
         
+        Con lines=True se escribe por chunks de CHUNK_SIZE filas en el mismo
+        archivo (JSON Lines permite concatenar): nunca se arma el texto del
+        DataFrame completo en memoria, y el archivo queda igual.
+        
         Args:
             df: DataFrame a guardar
             filename: Nombre del archivo
@@ -220,8 +427,15 @@ class DataLoader:
         if not filename.endswith('.json'):
             filename += '.json'
         
+        self._ensure_dir()
         filepath = self.output_dir / filename
-        df.to_json(filepath, orient=orient, lines=lines)
+        if lines and len(df) > CHUNK_SIZE:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                for start in range(0, len(df), CHUNK_SIZE):
+                    text = df.iloc[start:start + CHUNK_SIZE].to_json(orient=orient, lines=True)
+                    f.write(text if text.endswith('\n') else text + '\n')
+        else:
+            df.to_json(filepath, orient=orient, lines=lines)
         
         size_mb = filepath.stat().st_size / (1024 * 1024)
         print(f"✅ JSON guardado: {filepath.name} ({size_mb:.2f} MB)")
@@ -245,8 +459,9 @@ class DataLoader:
         if not filename.endswith('.parquet'):
             filename += '.parquet'
         
+        self._ensure_dir()
         filepath = self.output_dir / filename
-        df.to_parquet(filepath, compression=compression)
+        df.to_parquet(filepath, engine='pyarrow' if pa is not None else 'auto', compression=compression)
         
         size_mb = filepath.stat().st_size / (1024 * 1024)
         print(f"✅ Parquet guardado: {filepath.name} ({size_mb:.2f} MB)")
@@ -367,9 +582,12 @@ class DataLoader:
         backup_name = f"{stem}_{backup_suffix}{suffix}"
         backup_path = self.output_dir / backup_name
         
-        # Copiar archivo
-        import shutil
-        shutil.copy2(filepath, backup_path)
+        # Copiar archivo: copyfile copia el contenido dentro del kernel
+        # (sendfile/copy_file_range en Linux) y utime conserva las fechas,
+        # sin el resto de metadatos que copia copy2
+        st = filepath.stat()
+        shutil.copyfile(filepath, backup_path)
+        os.utime(backup_path, ns=(st.st_atime_ns, st.st_mtime_ns))
         
         size_mb = backup_path.stat().st_size / (1024 * 1024)
         print(f"✅ Backup creado: {backup_name} ({size_mb:.2f} MB)")
@@ -397,14 +615,21 @@ class DataLoader:
         if not json_filename.endswith('.json'):
             json_filename += '.json'
         
+        self._ensure_dir()
         filepath = self.output_dir / json_filename
         
         # Agregar timestamp
         metadata['created_at'] = datetime.now().isoformat()
         metadata['source_file'] = filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Misma salida que json.dump(indent=2, ensure_ascii=False); además
+            # acepta claves no str y números de NumPy
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            filepath.write_bytes(orjson.dumps(metadata, option=options))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, indent=2, ensure_ascii=False)
         
         print(f"✅ Metadatos guardados: {json_filename}")
         return filepath
@@ -424,8 +649,11 @@ class DataLoader:
         if not filepath.exists():
             raise FileNotFoundError(f"Archivo no encontrado: {filepath}")
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
+        if orjson is not None:
+            metadata = orjson.loads(filepath.read_bytes())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
         
         print(f"✅ Metadatos cargados: {json_filename}")
         return metadata
@@ -434,21 +662,71 @@ class DataLoader:
         """
         Lista archivos en el directorio de salida.
         
+        Usa os.scandir: el tipo de cada entrada viene en la misma lectura
+        del directorio (sin un stat() por archivo) y se ordena por nombre.
+        No imprime nada (el conteo va al logger del módulo, nivel DEBUG),
+        así que se puede llamar en un ciclo.
+        
         Args:
             extension: Filtrar por extensión (ej: '.csv')
             
         Returns:
-            Lista de paths
+            Lista de paths, ordenada por nombre
         """
-        if extension:
-            if not extension.startswith('.'):
-                extension = '.' + extension
-            files = list(self.output_dir.glob(f"*{extension}"))
+        if extension and not extension.startswith('.'):
+            extension = '.' + extension
+        
+        if not self.output_dir.is_dir():
+            return []
+        
+        with os.scandir(self.output_dir) as entries:
+            files = [
+                Path(entry.path) for entry in entries
+                if entry.is_file() and (not extension or entry.name.endswith(extension))
+            ]
+        files.sort(key=lambda path: path.name)
+        
+        logger.debug("%d archivos encontrados en %s", len(files), self.output_dir)
+        return files
+    
+    def _dispatch_save(self, df: pd.DataFrame, filename: str, format: str, **kwargs) -> Path:
+        """Llama al save_to_* que corresponde al formato."""
+        format = format.lower()
+        
+        if format == 'csv':
+            return self.save_to_csv(df, filename, **kwargs)
+        elif format in ['excel', 'xlsx']:
+            return self.save_to_excel(df, filename, **kwargs)
+        elif format == 'json':
+            return self.save_to_json(df, filename, **kwargs)
+        elif format == 'parquet':
+            return self.save_to_parquet(df, filename, **kwargs)
         else:
-            files = [f for f in self.output_dir.iterdir() if f.is_file()]
+            raise ValueError(f"Formato no soportado: {format}")
+    
+    def save_many(self,
+                  df: pd.DataFrame,
+                  jobs: List[Tuple[str, str]],
+                  max_workers: int = 4) -> List[Path]:
+        """
+        Guarda el mismo DataFrame en varios archivos/formatos a la vez.
         
-        print(f"✅ {len(files)} archivos encontrados")
-        return sorted(files)
+        Cada escritura va en un hilo: to_csv, to_parquet, etc. sueltan el
+        GIL mientras codifican y escriben, así que N formatos tardan cerca
+        de lo que tarda el más lento y no la suma.
+        
+        Args:
+            df: DataFrame a guardar (solo se lee, no se modifica)
+            jobs: Lista de (nombre de archivo, formato), ej.
+                  [('datos', 'csv'), ('datos', 'parquet')]
+            max_workers: Máximo de escrituras simultáneas
+            
+        Returns:
+            Paths guardados, en el mismo orden que jobs
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._dispatch_save, df, name, fmt) for name, fmt in jobs]
+            return [future.result() for future in futures]
     
     def get_file_info(self, filename: str) -> dict:
         """
@@ -486,7 +764,7 @@ class DataLoader:
 
 def save_data(df: pd.DataFrame,
              filename: str,
-             format: str = 'csv',
+             format: str = _DEFAULT_FORMAT,
              output_dir: Optional[Path] = None,
              **kwargs) -> Path:
     """
@@ -495,7 +773,8 @@ def save_data(df: pd.DataFrame,
     Args:
         df: DataFrame a guardar
         filename: Nombre del archivo
-        format: Formato ('csv', 'excel', 'json', 'parquet')
+        format: Formato ('csv', 'excel', 'json', 'parquet'); por defecto
+                'parquet' si PyArrow está instalado, si no 'csv'
         output_dir: Directorio de salida
         **kwargs: Argumentos adicionales
         
@@ -503,19 +782,7 @@ def save_data(df: pd.DataFrame,
         Path del archivo guardado
     """
     loader = DataLoader(output_dir)
-    
-    format = format.lower()
-    
-    if format == 'csv':
-        return loader.save_to_csv(df, filename, **kwargs)
-    elif format in ['excel', 'xlsx']:
-        return loader.save_to_excel(df, filename, **kwargs)
-    elif format == 'json':
-        return loader.save_to_json(df, filename, **kwargs)
-    elif format == 'parquet':
-        return loader.save_to_parquet(df, filename, **kwargs)
-    else:
-        raise ValueError(f"Formato no soportado: {format}")
+    return loader._dispatch_save(df, filename, format, **kwargs)
 
 
 def load_data(filename: str,
@@ -587,6 +854,7 @@ if __name__ == "__main__":
     print("\n💾 Guardando en diferentes formatos...")
     loader.save_to_csv(df_example, 'example_data.csv')
     loader.save_to_json(df_example, 'example_data.json')
+    save_data(df_example, 'example_data')  # Parquet (formato por defecto)
     
     # Crear metadatos
     metadata = {
@@ -599,6 +867,7 @@ if __name__ == "__main__":
     # Listar archivos
     print("\n📁 Archivos en Output:")
     files = loader.list_files()
+    print(f"✅ {len(files)} archivos encontrados")
     for f in files[:5]:  # Mostrar solo primeros 5
         print(f"  - {f.name}")
     
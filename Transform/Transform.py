@@ -48,10 +48,52 @@ datos limpios en información útil calculando métricas derivadas.
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 import pandas as pd
 import numpy as np
 
+# Bottleneck es opcional: su move_mean calcula el promedio móvil en una sola
+# pasada (suma acumulada) en lugar de la ventana de pandas.
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+# CuPy es opcional: con GPU NVIDIA la matriz de correlación de tablas grandes
+# se calcula con cuBLAS
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+# Dask es opcional: DataTransformer acepta un dask.dataframe.DataFrame y
+# calcula las agregaciones por partición en paralelo
+try:
+    import dask.dataframe as dd
+except ImportError:
+    dd = None
+
+# Polars es opcional: con transform_data(engine='polars') las operaciones
+# por fila se ejecutan como un solo plan lazy en su motor multihilo
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Celdas (filas x columnas) a partir de las cuales conviene copiar a la GPU
+_GPU_CORR_MIN_CELLS = 10_000_000
+
+# Numba es opcional: compila las máscaras de filter_outliers y la media
+# móvil por grupo a un solo recorrido nativo sin arreglos temporales.
+# Sin Numba se usa pandas/bottleneck.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 # ============================================================================
 # IMPORTAR CONFIGURACIONES
 # ============================================================================
@@ -75,6 +117,444 @@ except ImportError:
     NUMERIC_COLUMNS = ['cases', 'deaths', 'daily_cases', 'daily_deaths']
 
 
+# Los mensajes de cada transformación van al logger (nivel INFO) en lugar de
+# stdout: en lotes o en workers de Dask no se escribe nada salvo que se pida.
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# FUNCIONES AUXILIARES
+# ============================================================================
+
+def _grouped_move_mean(values: np.ndarray,
+                       codes: np.ndarray,
+                       window: int,
+                       center: bool,
+                       order: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Promedio móvil por grupo con bottleneck.move_mean, sin bucle por grupo.
+    
+    Reordena las filas para que cada grupo quede contiguo (orden estable, así
+    dentro del grupo se mantiene el orden por fecha), calcula UNA sola media
+    móvil sobre todo el arreglo y anula las ventanas que cruzan el borde de
+    un grupo. Igual que pandas con min_periods=window: una ventana incompleta
+    (o con NaN) da NaN. codes == -1 (clave nula) también da NaN.
+    
+    Args:
+        values: Valores float64 en el orden del DataFrame
+        codes: Código de grupo por fila (ngroup), -1 si la clave es nula
+        window: Tamaño de la ventana
+        center: Si True, centra la ventana como rolling(center=True)
+        order: np.argsort(codes, kind='stable') si ya se calculó
+    
+    Returns:
+        Arreglo float64 con el promedio móvil, en el orden original
+    """
+    if order is None:
+        order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    trailing = bn.move_mean(values[order], window=window, min_count=window)
+    
+    # Posición de cada fila dentro de su grupo y tamaño del grupo
+    n = len(values)
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    sizes = np.diff(np.r_[starts, n])
+    pos = np.arange(n) - np.repeat(starts, sizes)
+    size = np.repeat(sizes, sizes)
+    
+    # Con center=True el valor de la fila i es la media terminada en i + offset
+    offset = (window - 1) // 2 if center else 0
+    end = pos + offset
+    valid = (end >= window - 1) & (end < size) & (sorted_codes >= 0)
+    
+    result = np.full(n, np.nan)
+    idx = np.flatnonzero(valid)
+    result[idx] = trailing[idx + offset]
+    
+    out = np.empty(n)
+    out[order] = result
+    return out
+
+
+def _kahan_add(v: float, sign: int, nobs: int, total: float, comp: float):
+    """
+    Suma (sign=1) o resta (sign=-1) v a total con compensación de Kahan,
+    como add_mean/remove_mean de pandas. Un NaN no cuenta ni suma.
+    
+    Returns:
+        (nobs, total, comp) actualizados
+    """
+    if v == v:
+        nobs += sign
+        y = sign * v - comp
+        t = total + y
+        comp = (t - total) - y
+        total = t
+    return nobs, total, comp
+
+
+def _sliding_mean(values: np.ndarray,
+                  starts: np.ndarray,
+                  ends: np.ndarray,
+                  window: int,
+                  offset: int) -> np.ndarray:
+    """
+    Media móvil de cada tramo values[starts[g]:ends[g]] con suma deslizante.
+    
+    Cada valor entra y sale de la suma una sola vez (con compensación de
+    Kahan, como el kernel de pandas), así que el costo no depende de la
+    ventana. Igual que min_periods=window: ventana incompleta o con NaN da
+    NaN. El resultado de la ventana que termina en i va a la fila i - offset.
+    Los tramos son independientes y se reparten entre hilos (prange).
+    """
+    out = np.empty(values.shape[0])
+    for g in prange(starts.shape[0]):
+        start = starts[g]
+        end = ends[g]
+        nobs = 0
+        total = 0.0
+        comp = 0.0
+        for i in range(start, end):
+            nobs, total, comp = _kahan_add(values[i], 1, nobs, total, comp)
+            if i - window >= start:
+                nobs, total, comp = _kahan_add(values[i - window], -1, nobs, total, comp)
+            if i - offset >= start:
+                out[i - offset] = total / window if nobs == window else np.nan
+        # Filas cuya ventana centrada pasa del final del tramo
+        for j in range(max(start, end - offset), end):
+            out[j] = np.nan
+    return out
+
+
+def _fused_kernel(daily_cases: np.ndarray,
+                  daily_deaths: np.ndarray,
+                  cases: np.ndarray,
+                  deaths: np.ndarray,
+                  codes: np.ndarray,
+                  order: np.ndarray,
+                  starts: np.ndarray,
+                  ends: np.ndarray,
+                  window: int,
+                  offset: int,
+                  ma_cases: np.ndarray,
+                  ma_deaths: np.ndarray,
+                  mortality: np.ndarray,
+                  growth: np.ndarray):
+    """
+    Promedios móviles de daily_cases/daily_deaths, tasa de mortalidad y
+    tasa de crecimiento de daily_cases en UN recorrido de las filas.
+    
+    Recorre cada grupo en el orden de order[starts[g]:ends[g]] con dos
+    sumas deslizantes (como _sliding_mean) y escribe cada resultado en la
+    posición original. Una salida de largo 0 no se calcula (su columna de
+    entrada puede venir vacía).
+    """
+    do_ma = ma_cases.shape[0] > 0
+    do_mort = mortality.shape[0] > 0
+    do_growth = growth.shape[0] > 0
+    for g in prange(starts.shape[0]):
+        start = starts[g]
+        end = ends[g]
+        null_key = codes[order[start]] < 0
+        nobs_c = 0
+        total_c = 0.0
+        comp_c = 0.0
+        nobs_d = 0
+        total_d = 0.0
+        comp_d = 0.0
+        for k in range(start, end):
+            i = order[k]
+            if do_mort:
+                # cases == 0 queda NaN (cases NaN también da NaN)
+                mortality[i] = deaths[i] / cases[i] * 100 if cases[i] != 0 else np.nan
+            if do_growth:
+                if k == start or null_key:
+                    growth[i] = np.nan
+                else:
+                    growth[i] = (daily_cases[i] / daily_cases[order[k - 1]] - 1) * 100
+            if do_ma:
+                nobs_c, total_c, comp_c = _kahan_add(daily_cases[i], 1, nobs_c, total_c, comp_c)
+                nobs_d, total_d, comp_d = _kahan_add(daily_deaths[i], 1, nobs_d, total_d, comp_d)
+                if k - window >= start:
+                    j = order[k - window]
+                    nobs_c, total_c, comp_c = _kahan_add(daily_cases[j], -1, nobs_c, total_c, comp_c)
+                    nobs_d, total_d, comp_d = _kahan_add(daily_deaths[j], -1, nobs_d, total_d, comp_d)
+                if k - offset >= start:
+                    j = order[k - offset]
+                    ma_cases[j] = total_c / window if nobs_c == window and not null_key else np.nan
+                    ma_deaths[j] = total_d / window if nobs_d == window and not null_key else np.nan
+        if do_ma:
+            for k in range(max(start, end - offset), end):
+                ma_cases[order[k]] = np.nan
+                ma_deaths[order[k]] = np.nan
+
+
+def _grouped_sliding_mean(values: np.ndarray,
+                          codes: np.ndarray,
+                          window: int,
+                          center: bool,
+                          order: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Promedio móvil por grupo con el kernel _sliding_mean (Numba).
+    
+    Mismas entradas y resultado que _grouped_move_mean: las filas se
+    reordenan de forma estable por grupo, cada grupo es un tramo contiguo
+    y codes == -1 (clave nula) da NaN. order: como en _grouped_move_mean.
+    """
+    if order is None:
+        order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    n = len(values)
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    ends = np.r_[starts[1:], n]
+    
+    offset = (window - 1) // 2 if center else 0
+    result = _sliding_mean(values[order], starts, ends, window, offset)
+    result[sorted_codes < 0] = np.nan
+    
+    out = np.empty(n)
+    out[order] = result
+    return out
+
+
+def _range_mask(values: np.ndarray, lower: float, upper: float) -> np.ndarray:
+    """True donde lower <= valor <= upper (NaN da False)."""
+    mask = np.empty(values.shape[0], dtype=np.bool_)
+    for i in range(values.shape[0]):
+        mask[i] = lower <= values[i] <= upper
+    return mask
+
+
+def _zscore_mask(values: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    True donde |valor - media| / desviación < threshold (NaN da False).
+    
+    Media y varianza (ddof=1, como pandas) con Welford en un solo recorrido,
+    sin construir el arreglo de z-scores.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(values.shape[0]):
+        v = values[i]
+        if v == v:  # no es NaN
+            count += 1
+            delta = v - mean
+            mean += delta / count
+            m2 += delta * (v - mean)
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    
+    mask = np.empty(values.shape[0], dtype=np.bool_)
+    for i in range(values.shape[0]):
+        mask[i] = abs(values[i] - mean) / std < threshold
+    return mask
+
+
+def _top_positions(values: np.ndarray, n: int) -> np.ndarray:
+    """
+    Posiciones de los n valores más grandes, de mayor a menor.
+    
+    Equivale a Series.nlargest(n) (keep='first'; los NaN van al final y solo
+    si faltan valores) pero usa np.partition, O(N), para hallar el umbral y
+    solo ordena los n elegidos.
+    """
+    if n <= 0:
+        return np.empty(0, dtype=np.intp)
+    is_nan = np.isnan(values)
+    valid = np.flatnonzero(~is_nan)
+    if n < len(valid):
+        candidates = values[valid]
+        kth = np.partition(candidates, len(candidates) - n)[len(candidates) - n]
+        above = valid[candidates > kth]
+        # Empates en el umbral: gana el que aparece primero (keep='first')
+        ties = valid[candidates == kth][:n - len(above)]
+        valid = np.concatenate([above, ties])
+    # De mayor a menor; a igual valor, por posición
+    top = valid[np.lexsort((valid, -values[valid]))]
+    if n > len(top):
+        top = np.concatenate([top, np.flatnonzero(is_nan)[:n - len(top)]])
+    return top
+
+
+def _grouped_pct_change(values: np.ndarray,
+                        codes: np.ndarray,
+                        order: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Cambio relativo respecto a la fila anterior del mismo grupo, sin bucle
+    por grupo (como groupby().pct_change() sin rellenar NaN).
+    
+    Las filas se reordenan de forma estable por grupo, se divide cada valor
+    entre el anterior y se anula la primera fila de cada grupo. codes == -1
+    (clave nula) da NaN. Con Numba se hace en _pct_change_kernel sin
+    arreglos temporales.
+    """
+    if order is None:
+        order = np.argsort(codes, kind='stable')
+    if njit is not None:
+        return _pct_change_kernel(values, codes, order)
+    sorted_codes = codes[order]
+    sorted_values = values[order]
+    
+    result = np.full(len(values), np.nan)
+    same = (sorted_codes[1:] == sorted_codes[:-1]) & (sorted_codes[1:] >= 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = sorted_values[1:] / sorted_values[:-1] - 1
+    result[1:] = np.where(same, change, np.nan)
+    
+    out = np.empty(len(values))
+    out[order] = result
+    return out
+
+
+def _pct_change_kernel(values: np.ndarray,
+                       codes: np.ndarray,
+                       order: np.ndarray) -> np.ndarray:
+    """
+    values[i] / anterior - 1 recorriendo las filas en el orden por grupo,
+    sin reordenar los arreglos: el anterior de order[k] es order[k - 1] si
+    es del mismo grupo. Escribe directo en la posición original.
+    """
+    out = np.empty(values.shape[0])
+    for k in prange(order.shape[0]):
+        i = order[k]
+        if k > 0 and codes[i] >= 0 and codes[order[k - 1]] == codes[i]:
+            out[i] = values[i] / values[order[k - 1]] - 1
+        else:
+            out[i] = np.nan
+    return out
+
+
+def _chunk_moments(block: np.ndarray):
+    """count, suma, M2 (suma de desvíos²), min y max por columna, sin NaN."""
+    valid = ~np.isnan(block)
+    count = valid.sum(axis=0).astype('float64')
+    total = np.where(valid, block, 0.0).sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        m2 = np.where(valid, (block - total / count) ** 2, 0.0).sum(axis=0)
+    low = np.where(valid, block, np.inf).min(axis=0, initial=np.inf)
+    high = np.where(valid, block, -np.inf).max(axis=0, initial=-np.inf)
+    low[count == 0] = np.nan
+    high[count == 0] = np.nan
+    return count, total, m2, low, high
+
+
+def _merge_moments(a, b):
+    """Combina dos resultados de _chunk_moments (fórmula de Chan para M2)."""
+    count_a, total_a, m2_a, low_a, high_a = a
+    count_b, total_b, m2_b, low_b, high_b = b
+    count = count_a + count_b
+    both = (count_a > 0) & (count_b > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = total_b / count_b - total_a / count_a
+        m2 = m2_a + m2_b + np.where(both, delta ** 2 * count_a * count_b / count, 0.0)
+    return count, total_a + total_b, m2, np.fmin(low_a, low_b), np.fmax(high_a, high_b)
+
+
+def _nan_quantiles(values: np.ndarray):
+    """Percentiles 25/50/75 ignorando NaN (NaN si no hay valores)."""
+    valid = values[~np.isnan(values)]
+    if len(valid) == 0:
+        return np.nan, np.nan, np.nan
+    return tuple(np.quantile(valid, [0.25, 0.5, 0.75]))
+
+
+def _corr_block(Xi, Mi, Xj, Mj, xp=np):
+    """
+    Bloque de correlaciones entre las columnas de Xi y las de Xj.
+    
+    Xi/Xj ya vienen centradas y con 0 donde falta el valor; Mi/Mj son las
+    máscaras (1.0 = valor finito). Para el par (a, b): n = filas válidas en
+    ambas; s = suma de cada lado en esas filas; ss = suma de cuadrados.
+    """
+    same = Xi is Xj
+    n = Mi.T @ Mj
+    sxy = Xi.T @ Xj
+    si = Xi.T @ Mj
+    ssi = (Xi * Xi).T @ Mj
+    # En un bloque diagonal el lado j es la transpuesta del lado i
+    sj = si.T if same else Mi.T @ Xj
+    ssj = ssi.T if same else Mi.T @ (Xj * Xj)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sxy - si * sj / n
+        var_i = ssi - si * si / n
+        var_j = ssj - sj * sj / n
+        # Una columna constante en las filas del par da var ~1e-16 por
+        # redondeo en lugar de 0; pandas la trata como sin varianza (NaN)
+        var_i = xp.where(var_i <= ssi * 1e-12, xp.nan, var_i)
+        var_j = xp.where(var_j <= ssj * 1e-12, xp.nan, var_j)
+        return xp.clip(cov / xp.sqrt(var_i * var_j), -1.0, 1.0)
+
+
+def _pairwise_corr(X: np.ndarray,
+                   xp=np,
+                   n_split: int = 1,
+                   upper_only: bool = False) -> np.ndarray:
+    """
+    Correlación de Pearson entre columnas con pocas multiplicaciones de
+    matrices (BLAS) en lugar del bucle por pares de DataFrame.corr().
+    
+    Igual que pandas usa, para cada par, solo las filas donde ambos valores
+    son finitos (NaN e inf cuentan como faltantes). Las columnas se centran
+    antes con su media para no perder precisión al restar sumas grandes.
+    
+    Con n_split > 1 las columnas se parten en bloques y solo se calculan los
+    bloques (i, j) con j >= i: los temporales son de filas x bloque en lugar
+    de filas x columnas. El resto se copia por simetría salvo upper_only.
+    
+    Args:
+        X: Matriz float64 (filas x columnas)
+        xp: Módulo de arreglos (numpy o cupy)
+        n_split: Número de bloques de columnas
+        upper_only: Si True, deja NaN bajo la diagonal
+    
+    Returns:
+        Matriz columnas x columnas; NaN si un par no tiene varianza
+    """
+    valid = xp.isfinite(X)
+    M = valid.astype(X.dtype)
+    X = xp.where(valid, X, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        X -= X.sum(axis=0) / M.sum(axis=0)
+    X *= M
+    
+    k = X.shape[1]
+    n_split = max(1, min(n_split, k))
+    bounds = np.linspace(0, k, n_split + 1).astype(int)
+    blocks = [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:])]
+    
+    corr = xp.full((k, k), xp.nan)
+    for i, rows in enumerate(blocks):
+        Xi, Mi = X[:, rows], M[:, rows]
+        for cols in blocks[i:]:
+            if cols == rows:
+                block = _corr_block(Xi, Mi, Xi, Mi, xp)
+            else:
+                block = _corr_block(Xi, Mi, X[:, cols], M[:, cols], xp)
+            corr[rows, cols] = block
+            if not upper_only:
+                corr[cols, rows] = block.T
+    
+    if upper_only:
+        lower = xp.tril_indices(k, -1)
+        corr[lower] = xp.nan
+    diag = xp.arange(k)
+    corr[diag, diag] = xp.where(xp.isnan(corr[diag, diag]), xp.nan, 1.0)
+    return corr
+
+
+if njit is not None:
+    # error_model='numpy': x/0 da inf/NaN (como pandas) en vez de excepción
+    _range_mask = njit(cache=True)(_range_mask)
+    _zscore_mask = njit(cache=True, error_model='numpy')(_zscore_mask)
+    _kahan_add = njit(cache=True, inline='always')(_kahan_add)
+    _sliding_mean = njit(cache=True, nogil=True, parallel=True)(_sliding_mean)
+    _fused_kernel = njit(cache=True, nogil=True, parallel=True,
+                         error_model='numpy')(_fused_kernel)
+    _pct_change_kernel = njit(cache=True, nogil=True, parallel=True,
+                              error_model='numpy')(_pct_change_kernel)
+
+
 # ============================================================================
 # CLASE PRINCIPAL: DataTransformer
 # ============================================================================
@@ -91,27 +571,248 @@ class DataTransformer:
     - Correlaciones (qué variables se relacionan)
     """
     
-    def __init__(self, df: pd.DataFrame):
+    # Agregación por defecto de aggregate_by_state/county y de los rankings
+    _DEFAULT_GROUP_AGG = {
+        'cases': 'max',
+        'deaths': 'max',
+        'daily_cases': 'mean',
+        'daily_deaths': 'mean'
+    }
+    
+    def __init__(self,
+                 df: pd.DataFrame,
+                 copy: bool = True,
+                 scheduler: Optional[str] = None,
+                 float32: bool = False):
         """
         🏗️ CONSTRUCTOR - Inicializa el transformador
         
         Args:
-            df: DataFrame con datos limpios (después de Clean.py)
+            df: DataFrame con datos limpios (después de Clean.py). También
+                acepta un dask.dataframe.DataFrame (ver _materialize)
+            copy: Si False, no copia df: ahorra memoria con tablas grandes,
+                  pero las conversiones (fecha, category, int32) y las
+                  columnas nuevas se aplican sobre el DataFrame recibido
+                  (hasta que un reordenamiento o filtro cree uno nuevo)
+            scheduler: Scheduler de Dask para compute() ('threads',
+                       'processes', 'synchronous'); None = el de Dask
+            float32: Si True, también pasa a float32 las columnas flotantes
+                     cuyos valores no cambian (ej: movilidad en % enteros
+                     con NaN). Mitad de memoria, pero describe()/std se
+                     calculan en float32
         
         Qué hace:
-            - Copia el DataFrame (no modifica el original)
+            - Copia el DataFrame (no modifica el original, salvo copy=False)
             - Convierte columna 'date' a formato datetime si existe
+            - Convierte 'state' y 'county' a category (groupby más rápidos)
+            - Pasa las columnas enteras a int32 si caben (y las flotantes
+              a float32 sin pérdida si float32=True)
+            - NO lo reordena: se ordena por fecha UNA vez, la primera vez que
+              un promedio móvil o tasa de crecimiento lo necesita (los demás
+              métodos conservan el orden de filas del llamador)
         
         Ejemplo:
             >>> import pandas as pd
             >>> df = pd.read_csv("Output/IntegratedData_cleaned.csv")
             >>> transformer = DataTransformer(df)
         """
-        # Hacer una COPIA del DataFrame (no modificar el original)
-        self.df = df.copy()
+        self._scheduler = scheduler
+        self._float32 = float32
+        self._sorted = False
+        
+        # Agregaciones ya calculadas: {(claves, agg_dict): DataFrame} y
+        # objetos GroupBy por claves (los códigos de grupo se calculan una
+        # vez). Todo método que modifica self.df los vacía con _invalidate()
+        self._agg_cache = {}
+        self._groupby_cache = {}
+        # Orden estable por grupo (argsort de _key_codes) por claves: solo
+        # depende de las filas, así que sobrevive a las columnas nuevas
+        self._order_cache = {}
         
+        # Dask: el DataFrame queda perezoso. aggregate_by_* corren en
+        # paralelo por partición; el resto de métodos necesita filas
+        # ordenadas/completas y lo materializa una sola vez
+        self._is_dask = dd is not None and isinstance(df, dd.DataFrame)
+        if self._is_dask:
+            self.df = df
+            self._ensure_date_column()
+            return
+        
+        # Hacer una COPIA del DataFrame (no modificar el original)
+        self.df = df.copy() if copy else df
+        self._prepare()
+    
+    def _prepare(self):
+        """Prepara un DataFrame de pandas: fecha, claves y tipos."""
         # Asegurar que la columna 'date' esté en formato correcto
         self._ensure_date_column()
+        
+        # state/county como categóricas: todos los groupby de la clase agrupan
+        # por estas claves y así comparan códigos enteros en lugar de hashear
+        # texto en cada llamada (siempre con observed=True)
+        for key in ('state', 'county'):
+            if key in self.df.columns and not isinstance(self.df[key].dtype, pd.CategoricalDtype):
+                self.df[key] = self.df[key].astype('category')
+        
+        # Enteros a 32 bits: la mitad de bytes en cada operación
+        self._downcast_numeric()
+        
+        self._invalidate()
+    
+    def _materialize(self):
+        """
+        Con un DataFrame de Dask, lo calcula completo (una vez) y lo prepara
+        como pandas. Sin Dask no hace nada.
+        
+        Promedios móviles, tasas de crecimiento y filtros necesitan cada
+        serie entera y en orden; eso no se reparte bien entre particiones.
+        """
+        if self._is_dask:
+            self.df = self.df.compute(scheduler=self._scheduler)
+            self._is_dask = False
+            self._prepare()
+    
+    def _agg_cache_key(self, keys: List[str], agg_dict: dict):
+        """Clave de caché de una agregación; None si agg_dict no es hasheable."""
+        key = (tuple(keys), tuple(agg_dict.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _cached_agg(self, keys: List[str], agg_dict: dict) -> pd.DataFrame:
+        """
+        groupby(keys).agg(agg_dict) memorizado hasta que cambie self.df.
+        
+        Devuelve una copia para que el llamador pueda modificarla sin
+        alterar la caché. Si agg_dict no es hasheable (ej: listas de
+        funciones) se calcula sin guardar.
+        """
+        key = self._agg_cache_key(keys, agg_dict)
+        df_agg = self._agg_cache.get(key) if key is not None else None
+        if df_agg is None:
+            df_agg = self._compute(self._groupby(keys).agg(agg_dict))
+            if key is not None:
+                self._agg_cache[key] = df_agg
+        return df_agg.copy()
+    
+    def _groupby(self, keys: List[str]):
+        """
+        self.df.groupby(keys, observed=True) reutilizable.
+        
+        pandas guarda en el objeto GroupBy los códigos de grupo, así que
+        agregaciones, pct_change y ngroup sobre las mismas claves no vuelven
+        a hashearlas. Ordenado por claves, como el groupby por defecto.
+        """
+        by = tuple(keys)
+        grouped = self._groupby_cache.get(by)
+        if grouped is None:
+            grouped = self.df.groupby(keys[0] if len(keys) == 1 else list(keys), observed=True)
+            self._groupby_cache[by] = grouped
+        return grouped
+    
+    def _invalidate(self, rows: bool = True):
+        """
+        Descarta agregaciones y GroupBy guardados: self.df cambió.
+        
+        Con rows=False (solo se agregaron o reemplazaron columnas) se
+        conserva el orden por grupo de _group_order.
+        """
+        self._agg_cache.clear()
+        self._groupby_cache.clear()
+        if rows:
+            self._order_cache.clear()
+    
+    def _compute(self, result):
+        """Calcula un resultado agregado de Dask, ordenado como en pandas."""
+        if self._is_dask:
+            return result.compute(scheduler=self._scheduler).sort_index()
+        return result
+    
+    def _sort_by_date(self):
+        """
+        Ordena por fecha si aún no está ordenado.
+        
+        kind='stable': dentro de una misma fecha se conserva el orden de
+        entrada, así el resultado no depende del algoritmo de ordenamiento.
+        """
+        if not self._sorted:
+            # Ya ordenado (ej: datos leídos en orden): no se copia la tabla
+            if not self.df['date'].is_monotonic_increasing:
+                self.df = self.df.sort_values('date', kind='stable')
+                self._invalidate()
+            self._sorted = True
+    
+    def _downcast_numeric(self):
+        """
+        Reduce las columnas enteras a int32 (y las flotantes a float32 si
+        se pidió float32=True).
+        
+        - Solo si todos los valores caben (sin pérdida). No se baja a
+          int8/int16 ni a sin signo: restas como x - min podrían desbordarse
+        - Por defecto los flotantes se dejan en float64: describe()/std en
+          float32 acumulan error visible en las estadísticas. Con
+          float32=True solo se convierten si cada valor queda idéntico
+        """
+        int32 = np.iinfo(np.int32)
+        for col in self.df.columns:
+            series = self.df[col]
+            if (pd.api.types.is_integer_dtype(series)
+                    and not pd.api.types.is_bool_dtype(series)
+                    and series.dtype.itemsize > 4):
+                low, high = series.min(), series.max()
+                # Sin valores (vacía o toda <NA>): min/max dan NA y cualquier
+                # tipo sirve, así que se convierte directo
+                if pd.isna(low) or (int32.min <= low and high <= int32.max):
+                    nullable = isinstance(series.dtype, pd.api.extensions.ExtensionDtype)
+                    self.df[col] = series.astype('Int32' if nullable else 'int32')
+            elif self._float32 and series.dtype == np.float64:
+                values = series.to_numpy()
+                narrow = values.astype(np.float32)
+                # Igual ida y vuelta (NaN se compara aparte)
+                if np.array_equal(narrow.astype(np.float64), values, equal_nan=True):
+                    self.df[col] = narrow
+    
+    def _key_codes(self, keys: List[str]) -> np.ndarray:
+        """
+        Código entero por fila que identifica la combinación de claves
+        (-1 si alguna es nula). Los códigos no son consecutivos: solo sirven
+        para distinguir grupos.
+        
+        Con claves categóricas se combinan los cat.codes sin hashear nada;
+        con otros tipos se usa ngroup().
+        """
+        if not all(isinstance(self.df[key].dtype, pd.CategoricalDtype) for key in keys):
+            codes = self._groupby(keys).ngroup()
+            return codes.fillna(-1).to_numpy(dtype='int64')
+        
+        codes = np.zeros(len(self.df), dtype='int64')
+        valid = np.ones(len(self.df), dtype=bool)
+        for key in keys:
+            cat = self.df[key].cat
+            key_codes = cat.codes.to_numpy()
+            codes = codes * len(cat.categories) + key_codes
+            valid &= key_codes >= 0
+        codes[~valid] = -1
+        return codes
+    
+    def _group_order(self, keys: List[str]):
+        """
+        (códigos, orden) para los kernels por grupo: los códigos de
+        _key_codes y su argsort estable, calculados una vez por claves.
+        Sin claves todo es un solo grupo en el orden actual.
+        """
+        by = tuple(keys)
+        cached = self._order_cache.get(by)
+        if cached is None:
+            if keys:
+                codes = self._key_codes(keys)
+                cached = (codes, np.argsort(codes, kind='stable'))
+            else:
+                cached = (np.zeros(len(self.df), dtype='int64'), np.arange(len(self.df)))
+            self._order_cache[by] = cached
+        return cached
     
     def _ensure_date_column(self):
         """
@@ -128,15 +829,17 @@ class DataTransformer:
             - Permite calcular diferencias entre fechas
             - Necesario para agregaciones temporales
         """
-        if 'date' in self.df.columns:
+        if 'date' in self.df.columns and not pd.api.types.is_datetime64_any_dtype(self.df['date']):
             # Convertir a datetime
             # errors='coerce': Si falla, pone NaT en lugar de error
-            self.df['date'] = pd.to_datetime(self.df['date'], errors='coerce')
+            to_datetime = dd.to_datetime if self._is_dask else pd.to_datetime
+            self.df['date'] = to_datetime(self.df['date'], errors='coerce')
     
     def calculate_moving_average(self, 
                                  column: str, 
                                  window: int = None,
-                                 center: bool = True) -> pd.DataFrame:
+                                 center: bool = True,
+                                 engine: Optional[str] = None) -> pd.DataFrame:
         """
         📈 PROMEDIO MÓVIL - Suaviza fluctuaciones diarias
         
@@ -165,27 +868,184 @@ class DataTransformer:
             column: Nombre de la columna
             window: Ventana del promedio (días)
             center: Si True, centra la ventana
+            engine: Cómo se calcula
+                    None         = 'numba' si está instalado, si no
+                                   'bottleneck' y si no 'cython'
+                    'numba'      = suma deslizante compilada (_sliding_mean),
+                                   grupos repartidos entre hilos
+                    'bottleneck' = bottleneck.move_mean en una sola pasada
+                    'cython'     = rolling de pandas
+                    Si falta la librería se usa 'cython'
             
         Returns:
             DataFrame con columna adicional de promedio móvil
         """
+        self._materialize()
+        
         window = window or MOVING_AVERAGE_WINDOW
         
-        # Ordenar por fecha
-        self.df = self.df.sort_values('date')
+        if engine not in (None, 'bottleneck', 'cython', 'numba'):
+            raise ValueError(f"engine debe ser 'bottleneck', 'cython' o 'numba', no {engine!r}")
+        if engine is None:
+            engine = 'numba' if njit is not None else 'bottleneck'
+        if (engine == 'numba' and njit is None) or (engine == 'bottleneck' and bn is None):
+            engine = 'cython'
+        
+        # Ordenar por fecha (solo la primera vez que se necesita)
+        self._sort_by_date()
         
         # Calcular por grupo si hay county/state
-        if 'county' in self.df.columns and 'state' in self.df.columns:
-            self.df[f'{column}_ma{window}'] = (
-                self.df.groupby(['county', 'state'])[column]
-                .transform(lambda x: x.rolling(window=window, center=center).mean())
-            )
+        grouped = 'county' in self.df.columns and 'state' in self.df.columns
+        if engine in ('numba', 'bottleneck'):
+            # Una sola pasada sobre todas las filas (sin grupos: un solo tramo)
+            kernel = _grouped_sliding_mean if engine == 'numba' else _grouped_move_mean
+            values = self.df[column].to_numpy(dtype='float64', na_value=np.nan)
+            codes, order = self._group_order(['county', 'state'] if grouped else [])
+            self.df[f'{column}_ma{window}'] = kernel(values, codes, window, center, order)
+        elif grouped:
+            # Rolling agrupado directo (sin lambda por grupo): pandas llama al
+            # kernel en C una vez por grupo. Se agrupa sobre posiciones
+            # (reset_index) para devolver cada valor a su fila aunque el
+            # índice original tenga duplicados. No se usa engine='numba' de
+            # pandas: con miles de grupos fue ~20 veces más lento que esto.
+            subset = self.df[['county', 'state', column]].reset_index(drop=True)
+            grp = subset.groupby(['county', 'state'], sort=False, observed=True)[column]
+            ma = grp.rolling(window=window, center=center).mean()
+            out = np.full(len(subset), np.nan)
+            out[ma.index.get_level_values(-1)] = ma.to_numpy()
+            self.df[f'{column}_ma{window}'] = out
         else:
             self.df[f'{column}_ma{window}'] = (
                 self.df[column].rolling(window=window, center=center).mean()
             )
         
-        print(f"✅ Promedio móvil calculado: {column}_ma{window}")
+        self._invalidate(rows=False)
+        logger.info("✅ Promedio móvil calculado: %s_ma%d", column, window)
+        return self.df
+    
+    def _parallel_moving_averages(self,
+                                  columns: List[str],
+                                  window: int = None,
+                                  center: bool = True) -> pd.DataFrame:
+        """
+        Promedios móviles de varias columnas a la vez (requiere bottleneck).
+        
+        Cada columna escribe su propia columna de salida, así que los cálculos
+        son independientes: se lanzan en hilos y bottleneck/numpy sueltan el
+        GIL mientras calculan. Los códigos de grupo se calculan una sola vez
+        y las columnas se asignan al final, en el hilo principal.
+        
+        Args:
+            columns: Columnas a suavizar
+            window: Ventana en días (default: MOVING_AVERAGE_WINDOW)
+            center: Si True, centra la ventana
+            
+        Returns:
+            DataFrame con las columnas de promedio móvil
+        """
+        self._materialize()
+        window = window or MOVING_AVERAGE_WINDOW
+        self._sort_by_date()
+        
+        grouped = 'county' in self.df.columns and 'state' in self.df.columns
+        codes, order = self._group_order(['county', 'state'] if grouped else [])
+        arrays = [self.df[col].to_numpy(dtype='float64', na_value=np.nan) for col in columns]
+        
+        with ThreadPoolExecutor(max_workers=len(columns)) as ex:
+            futures = [ex.submit(_grouped_move_mean, values, codes, window, center, order)
+                       for values in arrays]
+            for col, fut in zip(columns, futures):
+                self.df[f'{col}_ma{window}'] = fut.result()
+        
+        self._invalidate(rows=False)
+        for col in columns:
+            logger.info("✅ Promedio móvil calculado: %s_ma%d", col, window)
+        return self.df
+    
+    def fused_transform(self,
+                        operations: List[str],
+                        window: int = None,
+                        center: bool = True) -> pd.DataFrame:
+        """
+        Aplica varias transformaciones con un solo recorrido de las filas.
+        
+        'moving_average' (daily_cases y daily_deaths), 'mortality_rate' y
+        'growth_rate' (daily_cases) se calculan juntos en _fused_kernel
+        (Numba): un solo orden por grupo, dos sumas deslizantes y las tasas
+        en el mismo bucle. 'time_features' se agrega después con
+        add_time_features(). Mismas columnas y valores que llamar a cada
+        método por separado. Sin Numba se llama a cada método.
+        
+        Args:
+            operations: Lista de operaciones (como en transform_data)
+            window: Ventana de los promedios móviles (default: 7)
+            center: Si True, centra la ventana
+            
+        Returns:
+            DataFrame con las columnas nuevas
+        """
+        self._materialize()
+        window = window or MOVING_AVERAGE_WINDOW
+        do_ma = 'moving_average' in operations
+        do_mort = 'mortality_rate' in operations
+        do_growth = 'growth_rate' in operations
+        
+        if njit is None:
+            if do_ma:
+                self.calculate_moving_average('daily_cases', window, center)
+                self.calculate_moving_average('daily_deaths', window, center)
+            if do_mort:
+                self.calculate_mortality_rate()
+            if do_growth:
+                self.calculate_growth_rate('daily_cases')
+        elif do_ma or do_mort or do_growth:
+            # La mortalidad es fila a fila: solo las ventanas necesitan orden
+            if do_ma or do_growth:
+                self._sort_by_date()
+            grouped = 'county' in self.df.columns and 'state' in self.df.columns
+            codes, order = self._group_order(['county', 'state'] if grouped else [])
+            sorted_codes = codes[order]
+            n = len(self.df)
+            starts = np.flatnonzero(np.r_[n > 0, sorted_codes[1:] != sorted_codes[:-1]])
+            ends = np.r_[starts[1:], n]
+            
+            def column(name, needed):
+                # Las columnas que no hacen falta se pasan vacías
+                if not needed:
+                    return np.empty(0)
+                return self.df[name].to_numpy(dtype='float64', na_value=np.nan)
+            
+            needed = {
+                f'daily_cases_ma{window}': do_ma,
+                f'daily_deaths_ma{window}': do_ma,
+                'mortality_rate': do_mort,
+                'daily_cases_growth_rate': do_growth,
+            }
+            outputs = {name: np.empty(n if flag else 0) for name, flag in needed.items()}
+            _fused_kernel(
+                column('daily_cases', do_ma or do_growth),
+                column('daily_deaths', do_ma),
+                column('cases', do_mort),
+                column('deaths', do_mort),
+                codes, order, starts, ends,
+                window, (window - 1) // 2 if center else 0,
+                *outputs.values(),
+            )
+            for name, values in outputs.items():
+                if needed[name]:
+                    self.df[name] = values
+            
+            self._invalidate(rows=False)
+            if do_ma:
+                logger.info("✅ Promedio móvil calculado: daily_cases_ma%d", window)
+                logger.info("✅ Promedio móvil calculado: daily_deaths_ma%d", window)
+            if do_mort:
+                logger.info("✅ Tasa de mortalidad calculada: mortality_rate")
+            if do_growth:
+                logger.info("✅ Tasa de crecimiento calculada: daily_cases_growth_rate")
+        
+        if 'time_features' in operations:
+            self.add_time_features()
         return self.df
     
     def calculate_growth_rate(self, column: str = 'daily_cases') -> pd.DataFrame:
@@ -198,17 +1058,19 @@ class DataTransformer:
         Returns:
             DataFrame con columna de tasa de crecimiento
         """
-        self.df = self.df.sort_values('date')
+        self._materialize()
         
-        if 'county' in self.df.columns and 'state' in self.df.columns:
-            self.df[f'{column}_growth_rate'] = (
-                self.df.groupby(['county', 'state'])[column]
-                .pct_change() * 100
-            )
-        else:
-            self.df[f'{column}_growth_rate'] = self.df[column].pct_change() * 100
+        self._sort_by_date()
         
-        print(f"✅ Tasa de crecimiento calculada: {column}_growth_rate")
+        # Igual que pct_change() * 100 (sin rellenar NaN), en numpy: la fila
+        # anterior del mismo grupo; la primera de cada grupo queda NaN
+        values = self.df[column].to_numpy(dtype='float64', na_value=np.nan)
+        grouped = 'county' in self.df.columns and 'state' in self.df.columns
+        codes, order = self._group_order(['county', 'state'] if grouped else [])
+        self.df[f'{column}_growth_rate'] = _grouped_pct_change(values, codes, order) * 100
+        
+        self._invalidate(rows=False)
+        logger.info("✅ Tasa de crecimiento calculada: %s_growth_rate", column)
         return self.df
     
     def calculate_mortality_rate(self) -> pd.DataFrame:
@@ -218,11 +1080,19 @@ class DataTransformer:
         Returns:
             DataFrame con columna mortality_rate
         """
-        self.df['mortality_rate'] = (
-            (self.df['deaths'] / self.df['cases']) * 100
-        ).replace([np.inf, -np.inf], np.nan)
+        self._materialize()
+        
+        # Una sola división: donde cases == 0 no se divide y queda el NaN
+        # inicial (nunca se genera inf que luego haya que reemplazar)
+        cases = self.df['cases'].to_numpy(dtype='float64', na_value=np.nan)
+        deaths = self.df['deaths'].to_numpy(dtype='float64', na_value=np.nan)
+        rate = np.full(cases.shape, np.nan)
+        np.divide(deaths, cases, out=rate, where=cases != 0)
+        rate *= 100
+        self.df['mortality_rate'] = rate
         
-        print("✅ Tasa de mortalidad calculada: mortality_rate")
+        self._invalidate(rows=False)
+        logger.info("✅ Tasa de mortalidad calculada: mortality_rate")
         return self.df
     
     def aggregate_by_date(self, agg_dict: Optional[dict] = None) -> pd.DataFrame:
@@ -243,8 +1113,8 @@ class DataTransformer:
                 'daily_deaths': 'sum'
             }
         
-        df_agg = self.df.groupby('date').agg(agg_dict).reset_index()
-        print(f"✅ Datos agregados por fecha: {len(df_agg)} fechas únicas")
+        df_agg = self._cached_agg(['date'], agg_dict).reset_index()
+        logger.info("✅ Datos agregados por fecha: %d fechas únicas", len(df_agg))
         return df_agg
     
     def aggregate_by_state(self, agg_dict: Optional[dict] = None) -> pd.DataFrame:
@@ -261,15 +1131,10 @@ class DataTransformer:
             raise ValueError("DataFrame no contiene columna 'state'")
         
         if agg_dict is None:
-            agg_dict = {
-                'cases': 'max',
-                'deaths': 'max',
-                'daily_cases': 'mean',
-                'daily_deaths': 'mean'
-            }
+            agg_dict = self._DEFAULT_GROUP_AGG
         
-        df_agg = self.df.groupby('state').agg(agg_dict).reset_index()
-        print(f"✅ Datos agregados por estado: {len(df_agg)} estados")
+        df_agg = self._cached_agg(['state'], agg_dict).reset_index()
+        logger.info("✅ Datos agregados por estado: %d estados", len(df_agg))
         return df_agg
     
     def aggregate_by_county(self, agg_dict: Optional[dict] = None) -> pd.DataFrame:
@@ -286,15 +1151,54 @@ class DataTransformer:
             raise ValueError("DataFrame no contiene columnas 'county' y 'state'")
         
         if agg_dict is None:
-            agg_dict = {
-                'cases': 'max',
-                'deaths': 'max',
-                'daily_cases': 'mean',
-                'daily_deaths': 'mean'
-            }
+            agg_dict = self._DEFAULT_GROUP_AGG
+        
+        df_agg = self._cached_agg(['county', 'state'], agg_dict).reset_index()
+        logger.info("✅ Datos agregados por condado: %d condados", len(df_agg))
+        return df_agg
+    
+    def _top_by(self, keys: List[str], metric: str, n: int, agg_dict: dict) -> pd.DataFrame:
+        """
+        Top N grupos por una métrica sin agregar todas las columnas de todos
+        los grupos.
+        
+        Primero agrega SOLO la métrica para rankear; después aplica agg_dict
+        completo únicamente a las filas de los N grupos ganadores. El
+        resultado (filas, orden e índice) es el mismo que
+        groupby(keys).agg(agg_dict).reset_index().nlargest(n, metric).
+        
+        Args:
+            keys: Columnas de agrupación
+            metric: Métrica para ordenar
+            n: Número de grupos a retornar
+            agg_dict: Agregación de cada columna
+            
+        Returns:
+            DataFrame con los top N grupos
+        """
+        self._materialize()
+        
+        if metric not in agg_dict or self._agg_cache_key(keys, agg_dict) in self._agg_cache:
+            # Agregación completa (ya en caché, o la métrica no se agrega y
+            # nlargest falla con KeyError igual que antes)
+            df_agg = self._cached_agg(keys, agg_dict).reset_index()
+            return df_agg.nlargest(n, metric)
         
-        df_agg = self.df.groupby(['county', 'state']).agg(agg_dict).reset_index()
-        print(f"✅ Datos agregados por condado: {len(df_agg)} condados")
+        # La posición de cada grupo en el ranking (groupby ordenado) es el
+        # índice que tendría la agregación completa después de reset_index()
+        ranking = self._cached_agg(keys, {metric: agg_dict[metric]})[metric]
+        top_pos = _top_positions(ranking.to_numpy(dtype='float64', na_value=np.nan), n)
+        top_keys = ranking.index[top_pos]
+        
+        # Filas candidatas: cada clave dentro de las ganadoras (puede colar
+        # combinaciones extra, p. ej. otro condado homónimo; .loc las descarta)
+        rows = np.logical_and.reduce([
+            self.df[key].isin(top_keys.get_level_values(key)).to_numpy()
+            for key in keys
+        ])
+        df_agg = self.df[rows].groupby(keys, observed=True).agg(agg_dict)
+        df_agg = df_agg.loc[top_keys].reset_index()
+        df_agg.index = top_pos
         return df_agg
     
     def get_top_counties(self, metric: str = 'cases', n: int = None) -> pd.DataFrame:
@@ -310,10 +1214,12 @@ class DataTransformer:
         """
         n = n or TOP_N_COUNTIES
         
-        df_agg = self.aggregate_by_county()
-        df_top = df_agg.nlargest(n, metric)
+        if 'county' not in self.df.columns or 'state' not in self.df.columns:
+            raise ValueError("DataFrame no contiene columnas 'county' y 'state'")
+        
+        df_top = self._top_by(['county', 'state'], metric, n, self._DEFAULT_GROUP_AGG)
         
-        print(f"✅ Top {n} condados por {metric}")
+        logger.info("✅ Top %d condados por %s", n, metric)
         return df_top
     
     def get_top_states(self, metric: str = 'cases', n: int = None) -> pd.DataFrame:
@@ -329,29 +1235,44 @@ class DataTransformer:
         """
         n = n or TOP_N_STATES
         
-        df_agg = self.aggregate_by_state()
-        df_top = df_agg.nlargest(n, metric)
+        if 'state' not in self.df.columns:
+            raise ValueError("DataFrame no contiene columna 'state'")
         
-        print(f"✅ Top {n} estados por {metric}")
+        df_top = self._top_by(['state'], metric, n, self._DEFAULT_GROUP_AGG)
+        
+        logger.info("✅ Top %d estados por %s", n, metric)
         return df_top
     
-    def calculate_correlation_matrix(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    def calculate_correlation_matrix(self,
+                                     columns: Optional[List[str]] = None,
+                                     upper_only: bool = False,
+                                     n_split: int = 1) -> pd.DataFrame:
         """
         Calcula matriz de correlación entre columnas numéricas.
         
         Args:
             columns: Lista de columnas a incluir (None = todas numéricas)
+            upper_only: Si True, solo el triángulo superior (abajo queda NaN)
+            n_split: Bloques de columnas para calcular por partes (menos
+                     memoria temporal con muchas columnas)
             
         Returns:
             DataFrame con matriz de correlación
         """
+        self._materialize()
+        
         if columns is None:
             numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
         else:
             numeric_cols = columns
         
-        corr_matrix = self.df[numeric_cols].corr()
-        print(f"✅ Matriz de correlación calculada: {len(numeric_cols)} variables")
+        X = self.df[numeric_cols].to_numpy(dtype='float64', na_value=np.nan)
+        if cp is not None and X.size >= _GPU_CORR_MIN_CELLS:
+            corr = cp.asnumpy(_pairwise_corr(cp.asarray(X), cp, n_split, upper_only))
+        else:
+            corr = _pairwise_corr(X, np, n_split, upper_only)
+        corr_matrix = pd.DataFrame(corr, index=numeric_cols, columns=numeric_cols)
+        logger.info("✅ Matriz de correlación calculada: %d variables", len(numeric_cols))
         return corr_matrix
     
     def add_time_features(self) -> pd.DataFrame:
@@ -361,24 +1282,36 @@ class DataTransformer:
         Returns:
             DataFrame con características temporales adicionales
         """
+        self._materialize()
+        
         if 'date' not in self.df.columns:
             raise ValueError("DataFrame no contiene columna 'date'")
         
         self._ensure_date_column()
         
-        # Características temporales
-        self.df['year'] = self.df['date'].dt.year
-        self.df['month'] = self.df['date'].dt.month
-        self.df['week'] = self.df['date'].dt.isocalendar().week
-        self.df['day'] = self.df['date'].dt.day
-        self.df['day_of_year'] = self.df['date'].dt.dayofyear
-        self.df['quarter'] = self.df['date'].dt.quarter
+        # Hay pocas fechas distintas (una por día): los campos se calculan
+        # una vez por fecha en un solo DatetimeIndex y se reparten a las
+        # filas con take(). Mismos valores y tipos (NaT incluido) que sobre
+        # cada fila, y una sola asignación con assign()
+        codes, dates = pd.factorize(self.df['date'], use_na_sentinel=False)
+        dates = pd.DatetimeIndex(dates)
+        features = {
+            'year': dates.year.to_numpy(),
+            'month': dates.month.to_numpy(),
+            'week': dates.isocalendar()['week'].array,
+            'day': dates.day.to_numpy(),
+            'day_of_year': dates.dayofyear.to_numpy(),
+            'quarter': dates.quarter.to_numpy(),
+        }
         
         # Ya existe day_of_week en los datos originales, pero podemos verificar
         if 'day_of_week' not in self.df.columns:
-            self.df['day_of_week'] = self.df['date'].dt.dayofweek
+            features['day_of_week'] = dates.dayofweek.to_numpy()
         
-        print("✅ Características temporales agregadas")
+        self.df = self.df.assign(**{name: values.take(codes) for name, values in features.items()})
+        
+        self._invalidate(rows=False)
+        logger.info("✅ Características temporales agregadas")
         return self.df
     
     def normalize_column(self, column: str, method: str = 'minmax') -> pd.DataFrame:
@@ -392,6 +1325,8 @@ class DataTransformer:
         Returns:
             DataFrame con columna normalizada
         """
+        self._materialize()
+        
         if column not in self.df.columns:
             raise ValueError(f"Columna '{column}' no encontrada")
         
@@ -410,7 +1345,8 @@ class DataTransformer:
         else:
             raise ValueError("Método debe ser 'minmax' o 'zscore'")
         
-        print(f"✅ Columna normalizada: {column}_normalized (método: {method})")
+        self._invalidate(rows=False)
+        logger.info("✅ Columna normalizada: %s_normalized (método: %s)", column, method)
         return self.df
     
     def filter_outliers(self, column: str, method: str = 'iqr', threshold: float = 1.5) -> pd.DataFrame:
@@ -425,59 +1361,225 @@ class DataTransformer:
         Returns:
             DataFrame sin outliers
         """
+        self._materialize()
+        
         initial_len = len(self.df)
         
+        if method not in ('iqr', 'zscore'):
+            raise ValueError("Método debe ser 'iqr' o 'zscore'")
+        
+        # Todo sobre el arreglo numpy: los dos cuartiles salen de una sola
+        # llamada y la máscara se aplica por posición (sin alinear índices)
+        values = self.df[column].to_numpy(dtype='float64', na_value=np.nan)
         if method == 'iqr':
-            Q1 = self.df[column].quantile(0.25)
-            Q3 = self.df[column].quantile(0.75)
+            Q1, Q3 = np.nanquantile(values, [0.25, 0.75])
             IQR = Q3 - Q1
             lower_bound = Q1 - threshold * IQR
             upper_bound = Q3 + threshold * IQR
-            self.df = self.df[
-                (self.df[column] >= lower_bound) & 
-                (self.df[column] <= upper_bound)
-            ]
-        elif method == 'zscore':
-            z_scores = np.abs((self.df[column] - self.df[column].mean()) / self.df[column].std())
-            self.df = self.df[z_scores < threshold]
+            if njit is not None:
+                # Numba: una pasada nativa que arma la máscara directamente
+                mask = _range_mask(values, lower_bound, upper_bound)
+            else:
+                mask = (values >= lower_bound) & (values <= upper_bound)
+        elif njit is not None:
+            mask = _zscore_mask(values, float(threshold))
         else:
-            raise ValueError("Método debe ser 'iqr' o 'zscore'")
+            with np.errstate(divide='ignore', invalid='ignore'):
+                z_scores = np.abs(values - np.nanmean(values)) / np.nanstd(values, ddof=1)
+            mask = z_scores < threshold
+        self.df = self.df.iloc[mask]
         
+        self._invalidate()
         removed = initial_len - len(self.df)
-        print(f"✅ Outliers removidos: {removed:,} filas ({removed/initial_len*100:.2f}%)")
+        logger.info("✅ Outliers removidos: %s filas (%.2f%%)", f"{removed:,}", removed / initial_len * 100)
         return self.df
     
-    def get_summary_statistics(self) -> pd.DataFrame:
+    def get_summary_statistics(self, chunk_size: Optional[int] = None) -> pd.DataFrame:
         """
         Obtiene estadísticas resumidas del dataset.
         
+        Args:
+            chunk_size: None = df.describe() de una vez. Con un número de
+                        filas, count/mean/std/min/max se acumulan por bloques
+                        (Welford/Chan) y los percentiles se sacan columna por
+                        columna: nunca se arma la matriz filas x columnas
+                        completa en float64. Mismo formato que describe()
+        
         Returns:
             DataFrame con estadísticas descriptivas
         """
-        stats = self.df.describe()
-        print("✅ Estadísticas resumidas generadas")
+        self._materialize()
+        
+        if chunk_size is None:
+            stats = self.df.describe()
+        else:
+            stats = self._describe_chunked(chunk_size)
+        logger.info("✅ Estadísticas resumidas generadas")
         return stats
+    
+    def _describe_chunked(self, chunk_size: int) -> pd.DataFrame:
+        """describe() por bloques de chunk_size filas (ver get_summary_statistics)."""
+        described = self.df.select_dtypes(include=[np.number, 'datetime'])
+        dates = described.select_dtypes(include=['datetime']).columns
+        numbers = described.columns.difference(dates, sort=False)
+        
+        # Momentos por bloque de filas, combinados al vuelo
+        moments = None
+        for start in range(0, len(self.df), max(1, chunk_size)):
+            block = described[numbers].iloc[start:start + chunk_size]
+            chunk = _chunk_moments(block.to_numpy(dtype='float64', na_value=np.nan))
+            moments = chunk if moments is None else _merge_moments(moments, chunk)
+        if moments is None:
+            moments = _chunk_moments(np.empty((0, len(numbers))))
+        count, total, m2, low, high = moments
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = total / count
+            std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+        
+        columns = {}
+        for i, col in enumerate(numbers):
+            values = described[col].to_numpy(dtype='float64', na_value=np.nan)
+            q25, q50, q75 = _nan_quantiles(values)
+            columns[col] = pd.Series(
+                [count[i], mean[i], std[i], low[i], q25, q50, q75, high[i]],
+                index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+            )
+        
+        # Fechas: como describe(), sin std y con Timestamps
+        for col in dates:
+            raw = described[col].to_numpy()
+            unit = np.datetime_data(raw.dtype)[0]
+            valid = raw[~np.isnat(raw)].view('i8').astype('float64')
+            if len(valid):
+                stats = [valid.mean(), valid.min(), *np.quantile(valid, [0.25, 0.5, 0.75]), valid.max()]
+                stats = [pd.Timestamp(np.datetime64(int(v), unit)) for v in stats]
+            else:
+                stats = [pd.NaT] * 6
+            columns[col] = pd.Series(
+                [len(valid)] + stats,
+                index=['count', 'mean', 'min', '25%', '50%', '75%', 'max'],
+                dtype=object
+            )
+        
+        # Mismo orden de filas y columnas que describe()
+        index = []
+        for col in described.columns:
+            index += [name for name in columns[col].index if name not in index]
+        return pd.concat(
+            [columns[col].reindex(index) for col in described.columns],
+            axis=1, keys=described.columns
+        )
 
 
-def transform_data(df: pd.DataFrame, operations: List[str] = None) -> pd.DataFrame:
+def _transform_data_polars(df: pd.DataFrame, operations: List[str]) -> pd.DataFrame:
+    """
+    Versión de transform_data sobre el API lazy de Polars.
+    
+    Todas las operaciones se agregan como expresiones (with_columns) a un
+    mismo LazyFrame y Polars las ejecuta juntas, en varios hilos, con un
+    solo collect(). Mismos resultados que los métodos de DataTransformer:
+    orden estable por fecha solo si hay ventanas (promedio móvil o
+    crecimiento), ventanas por (county, state) con min_samples=window y NaN
+    en filas con clave nula.
+    """
+    if 'date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['date']):
+        df = df.assign(date=pd.to_datetime(df['date'], errors='coerce'))
+    
+    # La posición original permite devolver el índice de pandas tal cual
+    lf = pl.from_pandas(df.reset_index(drop=True)).lazy().with_row_index('__pos')
+    if 'date' in df.columns and ('moving_average' in operations or 'growth_rate' in operations):
+        lf = lf.sort('date', nulls_last=True, maintain_order=True)
+    
+    keys = [key for key in ('county', 'state') if key in df.columns]
+    keys = keys if len(keys) == 2 else []
+    
+    def by_group(expr):
+        # Por (county, state); las filas con clave nula quedan en NaN
+        if not keys:
+            return expr
+        return pl.when(pl.all_horizontal(pl.col(keys).is_not_null())).then(expr.over(keys))
+    
+    window = MOVING_AVERAGE_WINDOW
+    exprs = []
+    if 'moving_average' in operations:
+        for col in ('daily_cases', 'daily_deaths'):
+            ma = pl.col(col).cast(pl.Float64).rolling_mean(window, min_samples=window, center=True)
+            exprs.append(by_group(ma).alias(f'{col}_ma{window}'))
+    if 'mortality_rate' in operations:
+        cases = pl.col('cases').cast(pl.Float64)
+        exprs.append(
+            pl.when(cases != 0).then(pl.col('deaths') / cases * 100).alias('mortality_rate')
+        )
+    if 'growth_rate' in operations:
+        values = pl.col('daily_cases').cast(pl.Float64)
+        exprs.append(
+            by_group((values / values.shift(1) - 1) * 100).alias('daily_cases_growth_rate')
+        )
+    if 'time_features' in operations:
+        date = pl.col('date').dt
+        # Mismos tipos que DatetimeIndex (int32; la semana ISO, UInt32, se
+        # convierte después porque to_pandas() la deja como uint32)
+        exprs += [
+            date.year().cast(pl.Int32).alias('year'),
+            date.month().cast(pl.Int32).alias('month'),
+            date.week().cast(pl.UInt32).alias('week'),
+            date.day().cast(pl.Int32).alias('day'),
+            date.ordinal_day().cast(pl.Int32).alias('day_of_year'),
+            date.quarter().cast(pl.Int32).alias('quarter'),
+        ]
+        if 'day_of_week' not in df.columns:
+            exprs.append((date.weekday() - 1).cast(pl.Int32).alias('day_of_week'))
+    
+    result = lf.with_columns(exprs).collect()
+    out = result.drop('__pos').to_pandas()
+    out.index = df.index[result['__pos'].to_numpy()]
+    if 'time_features' in operations:
+        out['week'] = out['week'].astype('UInt32')
+    # Mismos tipos que el camino de pandas (category, int32)
+    return DataTransformer(out, copy=False).df
+
+
+def transform_data(df: pd.DataFrame,
+                   operations: List[str] = None,
+                   scheduler: Optional[str] = None,
+                   engine: str = 'pandas') -> pd.DataFrame:
     """
     Función de conveniencia para aplicar múltiples transformaciones.
     
     Args:
-        df: DataFrame a transformar
+        df: DataFrame a transformar (pandas o Dask)
         operations: Lista de operaciones a aplicar
+        scheduler: Scheduler de Dask para calcular df (ej: 'processes')
+        engine: 'pandas' (métodos de DataTransformer) o 'polars' (un solo
+                plan lazy; si Polars no está instalado se usa 'pandas')
         
     Returns:
         DataFrame transformado
     """
-    transformer = DataTransformer(df)
+    if engine not in ('pandas', 'polars'):
+        raise ValueError(f"engine debe ser 'pandas' o 'polars', no {engine!r}")
     
     if operations is None:
         operations = ['moving_average', 'mortality_rate', 'time_features']
     
+    if engine == 'polars' and pl is not None:
+        if dd is not None and isinstance(df, dd.DataFrame):
+            df = df.compute(scheduler=scheduler)
+        return _transform_data_polars(df, operations)
+    
+    transformer = DataTransformer(df, scheduler=scheduler)
+    
+    if njit is not None:
+        # Un solo recorrido (Numba) para promedios móviles y tasas
+        return transformer.fused_transform(operations)
+    
     if 'moving_average' in operations:
-        transformer.calculate_moving_average('daily_cases')
-        transformer.calculate_moving_average('daily_deaths')
+        if bn is not None:
+            # Independientes entre sí: se calculan en paralelo
+            transformer._parallel_moving_averages(['daily_cases', 'daily_deaths'])
+        else:
+            transformer.calculate_moving_average('daily_cases')
+            transformer.calculate_moving_average('daily_deaths')
     
     if 'mortality_rate' in operations:
         transformer.calculate_mortality_rate()
@@ -492,6 +1594,7 @@ def transform_data(df: pd.DataFrame, operations: List[str] = None) -> pd.DataFra
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("="*60)
     print("MÓDULO DE TRANSFORMACIÓN DE DATOS")
     print("="*60)
@@ -499,14 +1602,17 @@ if __name__ == "__main__":
     # Ejemplo con datos sintéticos
     print("\n📊 Creando datos de ejemplo...")
     dates = pd.date_range('2021-01-01', periods=30)
+    # Una sola llamada al generador: columnas cases, deaths, daily_cases, daily_deaths
+    rng = np.random.default_rng(0)
+    valores = rng.integers([10, 0, 10, 0], [100, 10, 100, 10], size=(30, 4), dtype=np.int32)
     df_example = pd.DataFrame({
         'date': dates,
         'county': ['Example'] * 30,
         'state': ['State'] * 30,
-        'cases': np.cumsum(np.random.randint(10, 100, 30)),
-        'deaths': np.cumsum(np.random.randint(0, 10, 30)),
-        'daily_cases': np.random.randint(10, 100, 30),
-        'daily_deaths': np.random.randint(0, 10, 30)
+        'cases': np.cumsum(valores[:, 0]),
+        'deaths': np.cumsum(valores[:, 1]),
+        'daily_cases': valores[:, 2],
+        'daily_deaths': valores[:, 3]
     })
     
     # Aplicar transformaciones
@@ -523,10 +523,13 @@ def main(argv: Optional[list[str]] = None) -> None:
     ensure_outdir(args.outdir)
 
     print("Cargando dataset limpio...")
-    df = pd.read_csv(args.input, low_memory=False)
+    # Sin low_memory=False (que carga todo el texto antes de inferir los
+    # tipos); la fecha se parsea al leer
+    header = pd.read_csv(args.input, nrows=0).columns
+    df = pd.read_csv(args.input, parse_dates=["date"] if "date" in header else None)
 
-    # Asegurar formatos mínimos
-    if "date" in df.columns:
+    # Asegurar formatos mínimos (fechas que no se pudieron parsear → NaT)
+    if "date" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["date"]):
         df["date"] = pd.to_datetime(df["date"], errors="coerce")
 
     results = []
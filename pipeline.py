@@ -107,7 +107,7 @@ class COVIDPipeline:
         
         # Cargar datos limpios
         print("\n📂 Cargando datos limpios...")
-        df_clean = pd.read_csv(self.cleaned_file)
+        df_clean = pd.read_csv(self.cleaned_file, parse_dates=['date'])
         
         print(f"✅ Datos limpios: {len(df_clean):,} filas, {len(df_clean.columns)} columnas")
         return df_clean
@@ -329,7 +329,7 @@ def main():
     
     # Mostrar configuración si se solicita
     if args.show_config:
-        print(get_config_summary())
+        print(dict(get_config_summary()))
         return
     
     # Ejecutar pipeline
@@ -0,0 +1,38 @@
+"""Pruebas de DataLoader."""
+
+import numpy as np
+import pandas as pd
+
+from Load.Load import DataLoader
+
+
+def _frame():
+    return pd.DataFrame({
+        'date': pd.to_datetime(['2021-01-01', None, '2021-01-03', '2021-01-04', '2021-01-05']),
+        'county': pd.Categorical(['Autauga', 'Baldwin', 'Autauga', 'Barbour', 'Baldwin']),
+        'state': ['Alabama', 'Alabama, US', None, 'Alabama', 'Alabama'],
+        'fips': [1001, 1003, 1001, 1005, 1003],
+        'cases': pd.array([1, None, 3, 4, 5], dtype='Int64'),
+        'deaths': [0.0, np.nan, -46.0, 1e15, 2.0],
+        'is_weekend': [True, False, True, False, True],
+    })
+
+
+def _both(tmp_path, df):
+    loader = DataLoader(tmp_path)
+    full = loader.save_to_csv(df, 'full.csv').read_bytes()
+    chunked = loader.save_to_csv_chunked(df, 'chunked.csv', chunk_size=2).read_bytes()
+    return full, chunked
+
+
+def test_csv_chunked_matches_to_csv(tmp_path):
+    full, chunked = _both(tmp_path, _frame())
+    assert chunked == full
+
+
+def test_csv_chunked_matches_to_csv_with_fractional_floats(tmp_path):
+    df = _frame()
+    df['deaths'] = [0.5, np.nan, 1e-05, 1e16, 2.25]
+    df['date'] = df['date'] + pd.Timedelta(hours=1)
+    full, chunked = _both(tmp_path, df)
+    assert chunked == full
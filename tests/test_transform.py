@@ -0,0 +1,60 @@
+"""Pruebas de DataTransformer."""
+
+import pandas as pd
+
+from Transform.Transform import DataTransformer, transform_data
+
+
+def test_downcast_all_na_nullable_int():
+    df = pd.DataFrame({'date': ['2021-01-01'], 'x': pd.array([None], dtype='Int64')})
+    result = DataTransformer(df).df
+    assert result['x'].dtype == 'Int32'
+    assert result['x'].isna().all()
+
+
+def test_downcast_empty_nullable_int():
+    df = pd.DataFrame({
+        'date': pd.Series([], dtype='datetime64[ns]'),
+        'cases': pd.array([], dtype='Int64'),
+        'deaths': pd.array([], dtype='Int64'),
+        'daily_cases': pd.array([], dtype='Int64'),
+        'daily_deaths': pd.array([], dtype='Int64'),
+    })
+    assert DataTransformer(df).df['cases'].dtype == 'Int32'
+    assert len(transform_data(df)) == 0
+
+
+def test_downcast_keeps_values_out_of_int32_range():
+    df = pd.DataFrame({'date': ['2021-01-01', '2021-01-02'],
+                       'x': pd.array([1, 2**40], dtype='Int64')})
+    assert DataTransformer(df).df['x'].dtype == 'Int64'
+
+
+def _unsorted_frame():
+    return pd.DataFrame({
+        'date': ['2021-01-03', '2021-01-01', '2021-01-02', '2021-01-01'],
+        'county': ['a', 'a', 'a', 'b'],
+        'state': ['x', 'x', 'x', 'x'],
+        'cases': [30, 10, 20, 5],
+        'deaths': [3, 1, 2, 0],
+        'daily_cases': [10, 10, 10, 5],
+        'daily_deaths': [1, 1, 1, 0],
+    }, index=[10, 11, 12, 13])
+
+
+def test_row_wise_methods_keep_caller_order():
+    df = _unsorted_frame()
+    transformer = DataTransformer(df)
+    assert list(transformer.df.index) == list(df.index)
+    assert list(transformer.calculate_mortality_rate().index) == list(df.index)
+    assert list(transformer.add_time_features().index) == list(df.index)
+    assert list(transformer.normalize_column('cases').index) == list(df.index)
+    assert list(transformer.filter_outliers('cases', threshold=10).index) == list(df.index)
+    assert list(transform_data(df, ['mortality_rate', 'time_features']).index) == list(df.index)
+
+
+def test_window_methods_sort_by_date():
+    transformer = DataTransformer(_unsorted_frame())
+    result = transformer.calculate_growth_rate('daily_cases')
+    assert list(result.index) == [11, 13, 12, 10]
+    assert result.loc[10, 'daily_cases_growth_rate'] == 0